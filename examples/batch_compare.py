@@ -4,6 +4,7 @@ Batch comparison example - Compare multiple topics and generate a summary
 """
 
 import sys
+from operator import itemgetter
 sys.path.insert(0, '..')
 
 from main import ComparisonOrchestrator
@@ -31,20 +32,30 @@ def batch_compare(topics: list, generate_reports: bool = True):
     print("QUICK SUMMARY")
     print("=" * 80)
 
-    if orchestrator.results:
-        avg_similarity = sum(r.text_similarity for r in orchestrator.results) / len(orchestrator.results)
+    results = orchestrator.results
+    if results:
+        # Single pass for the average and the extremes
+        sims = [r.text_similarity for r in results]
+        total = 0.0
+        most_similar = most_different = results[0]
+        best = worst = sims[0]
+        for result, sim in zip(results, sims):
+            total += sim
+            if sim > best:
+                best, most_similar = sim, result
+            elif sim < worst:
+                worst, most_different = sim, result
+
+        avg_similarity = total / len(sims)
         print(f"\nAverage Similarity: {avg_similarity:.2%}")
 
         print("\nResults by topic:")
-        for result in sorted(orchestrator.results, key=lambda r: r.text_similarity, reverse=True):
-            print(f"  {result.topic:<40} {result.text_similarity:.2%} ({result.similarity_category})")
+        for sim, result in sorted(zip(sims, results), key=itemgetter(0), reverse=True):
+            print(f"  {result.topic:<40} {sim:.2%} ({result.similarity_category})")
 
         # Identify interesting cases
-        most_similar = max(orchestrator.results, key=lambda r: r.text_similarity)
-        most_different = min(orchestrator.results, key=lambda r: r.text_similarity)
-
-        print(f"\nMost Similar: {most_similar.topic} ({most_similar.text_similarity:.2%})")
-        print(f"Most Different: {most_different.topic} ({most_different.text_similarity:.2%})")
+        print(f"\nMost Similar: {most_similar.topic} ({best:.2%})")
+        print(f"Most Different: {most_different.topic} ({worst:.2%})")
 
         # Generate reports if requested
         if generate_reports:
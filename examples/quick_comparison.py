@@ -81,11 +81,11 @@ def quick_compare(topic: str):
     print(f"\nQuality Metrics:")
     grok_quality = analyzer.calculate_quality_metrics(
         grok_page.text_content,
-        len(grok_page.citations)
+        grok_page.citation_count
     )
     wiki_quality = analyzer.calculate_quality_metrics(
         wiki_page.text_content,
-        len(wiki_page.citations)
+        wiki_page.citation_count
     )
 
     print(f"  Readability (Grokipedia): {grok_quality.readability_score:.1f}")
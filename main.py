@@ -4,18 +4,51 @@ Main orchestrator for Grokipedia vs Wikipedia comparison
 """
 
 import argparse
+import asyncio
+import os
 import sys
 import json
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
 from tqdm import tqdm
 
 from src.samplers.topic_sampler import TopicSampler
 from src.scrapers.wikipedia_scraper import WikipediaScraper
 from src.scrapers.grokipedia_scraper import GrokipediaScraper
 from src.comparators.page_comparator import PageComparator, ComparisonResult
-from src.analyzers.metrics_analyzer import MetricsAnalyzer
-from src.visualizers.report_generator import ReportGenerator
+from src.analyzers.metrics_analyzer import MetricsAnalyzer, QualityMetrics, BiasMetrics
+from src.visualizers.report_generator import ReportGenerator, page_metrics_to_dict
+
+
+# Per-process analyzer used by _analyze_pair (created lazily in each worker)
+_worker_analyzer: Optional[MetricsAnalyzer] = None
+
+
+def _analyze_pair(args: Tuple[str, int, str, int]) -> Tuple[QualityMetrics, BiasMetrics, QualityMetrics, BiasMetrics]:
+    """
+    Calculate quality and bias metrics for a Grokipedia/Wikipedia text pair.
+
+    Defined at module level so it can be dispatched to worker processes.
+
+    Args:
+        args: (grokipedia_text, grokipedia_citations, wikipedia_text, wikipedia_citations)
+
+    Returns:
+        (grokipedia_quality, grokipedia_bias, wikipedia_quality, wikipedia_bias)
+    """
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = MetricsAnalyzer()
+
+    grok_text, grok_citations, wiki_text, wiki_citations = args
+    return (
+        _worker_analyzer.calculate_quality_metrics(grok_text, grok_citations),
+        _worker_analyzer.calculate_bias_metrics(grok_text),
+        _worker_analyzer.calculate_quality_metrics(wiki_text, wiki_citations),
+        _worker_analyzer.calculate_bias_metrics(wiki_text)
+    )
 
 
 class ComparisonOrchestrator:
@@ -23,29 +56,32 @@ class ComparisonOrchestrator:
     Main orchestrator for running comparisons between Grokipedia and Wikipedia.
     """
 
-    def __init__(self, config_path: str = "config/sampling_config.yaml"):
+    def __init__(self, config_path: str = "config/sampling_config.yaml", cache_dir: Optional[str] = None):
         """
         Initialize the orchestrator.
 
         Args:
             config_path: Path to configuration file
+            cache_dir: Directory for cached page downloads (disabled if None)
         """
         self.sampler = TopicSampler(config_path)
-        self.wikipedia_scraper = WikipediaScraper()
-        self.grokipedia_scraper = GrokipediaScraper()
+        self.wikipedia_scraper = WikipediaScraper(cache_dir=cache_dir)
+        self.grokipedia_scraper = GrokipediaScraper(cache_dir=cache_dir)
         self.comparator = PageComparator()
         self.analyzer = MetricsAnalyzer()
         self.report_generator = ReportGenerator()
 
         self.results: List[ComparisonResult] = []
 
-    def run_comparison(self, sample_size: int = 10, topics: Optional[List[str]] = None):
+    def run_comparison(self, sample_size: int = 10, topics: Optional[List[str]] = None,
+                       max_concurrency: int = 4):
         """
         Run the comparison process.
 
         Args:
             sample_size: Number of topics to sample (if topics not provided)
             topics: Optional list of specific topics to compare
+            max_concurrency: Maximum number of topics fetched concurrently
         """
         # Get topics to compare
         if topics:
@@ -56,22 +92,47 @@ class ComparisonOrchestrator:
 
         print(f"Comparing {len(topic_list)} topics...")
 
-        # Process each topic
-        for category, topic in tqdm(topic_list, desc="Processing topics"):
-            try:
-                result = self._compare_topic(topic, category)
-                if result:
-                    self.results.append(result)
-            except Exception as e:
-                print(f"Error processing '{topic}': {e}")
-                continue
+        # Process topics concurrently (results keep the original topic order)
+        results = asyncio.run(self._compare_topics_async(topic_list, max_concurrency))
+        self.results.extend(result for result in results if result)
 
         print(f"\nSuccessfully compared {len(self.results)} topics.")
 
-    def _compare_topic(self, topic: str, category: Optional[str]) -> Optional[ComparisonResult]:
+    async def _compare_topics_async(self, topic_list: List[Tuple[Optional[str], str]],
+                                    max_concurrency: int) -> List[Optional[ComparisonResult]]:
+        """
+        Compare topics with at most max_concurrency topics in flight.
+
+        Args:
+            topic_list: List of (category, topic) tuples
+            max_concurrency: Maximum number of topics processed at once
+
+        Returns:
+            List of ComparisonResult (or None for failures), in input order
+        """
+        semaphore = asyncio.BoundedSemaphore(max(1, max_concurrency))
+
+        with tqdm(total=len(topic_list), desc="Processing topics") as progress:
+            async def bounded(category: Optional[str], topic: str) -> Optional[ComparisonResult]:
+                async with semaphore:
+                    try:
+                        return await self._compare_topic_async(topic, category)
+                    except Exception as e:
+                        print(f"Error processing '{topic}': {e}")
+                        return None
+                    finally:
+                        progress.update(1)
+
+            return await asyncio.gather(
+                *(bounded(category, topic) for category, topic in topic_list)
+            )
+
+    async def _compare_topic_async(self, topic: str, category: Optional[str]) -> Optional[ComparisonResult]:
         """
         Compare a single topic between Grokipedia and Wikipedia.
 
+        Both pages are fetched concurrently.
+
         Args:
             topic: Topic to compare
             category: Category of the topic
@@ -79,14 +140,15 @@ class ComparisonOrchestrator:
         Returns:
             ComparisonResult or None if failed
         """
-        # Fetch from Wikipedia
-        wiki_page = self.wikipedia_scraper.fetch_and_parse(topic)
+        wiki_page, grok_page = await asyncio.gather(
+            self.wikipedia_scraper.afetch_and_parse(topic),
+            self.grokipedia_scraper.afetch_and_parse(topic)
+        )
+
         if not wiki_page:
             print(f"  Failed to fetch Wikipedia page for '{topic}'")
             return None
 
-        # Fetch from Grokipedia
-        grok_page = self.grokipedia_scraper.fetch_and_parse(topic)
         if not grok_page:
             print(f"  Failed to fetch Grokipedia page for '{topic}'")
             return None
@@ -101,31 +163,74 @@ class ComparisonOrchestrator:
 
         return result
 
+    def analyze_results(self, max_workers: Optional[int] = None):
+        """
+        Calculate quality and bias metrics for both pages of every result.
+
+        Metrics are stored in each page's metadata under 'quality_metrics'
+        and 'bias_metrics', and are written out by save_results and the
+        JSON export. The analysis is CPU-bound and independent per page, so
+        larger batches are spread across a process pool.
+
+        Args:
+            max_workers: Number of worker processes (default: CPU count)
+        """
+        jobs = [
+            (
+                result.grokipedia_page.text_content,
+                result.grokipedia_page.citation_count,
+                result.wikipedia_page.text_content,
+                result.wikipedia_page.citation_count
+            )
+            for result in self.results
+        ]
+
+        # Pool startup isn't worth it for a handful of pages
+        if len(jobs) >= 4:
+            workers = max_workers or os.cpu_count() or 1
+            chunksize = max(1, min(8, len(jobs) // workers))
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                metrics = list(executor.map(_analyze_pair, jobs, chunksize=chunksize))
+        else:
+            metrics = [_analyze_pair(job) for job in jobs]
+
+        for result, (grok_quality, grok_bias, wiki_quality, wiki_bias) in zip(self.results, metrics):
+            result.grokipedia_page.metadata['quality_metrics'] = grok_quality
+            result.grokipedia_page.metadata['bias_metrics'] = grok_bias
+            result.wikipedia_page.metadata['quality_metrics'] = wiki_quality
+            result.wikipedia_page.metadata['bias_metrics'] = wiki_bias
+
     def save_results(self, output_path: str = "data/processed/comparison_results.json"):
         """
         Save comparison results to JSON file.
 
+        Results analyzed by analyze_results also carry each page's quality
+        and bias metrics.
+
         Args:
             output_path: Path to save results
         """
         output_file = Path(output_path)
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
-        data = []
-        for result in self.results:
-            data.append({
-                'topic': result.topic,
-                'text_similarity': result.text_similarity,
-                'similarity_category': result.similarity_category,
-                'word_count_diff': result.word_count_diff,
-                'citation_diff': result.citation_diff,
-                'section_overlap': result.section_overlap,
-                'key_differences': result.key_differences,
-                'timestamp': result.timestamp.isoformat()
-            })
-
+        # Stream one record at a time (same layout as json.dump(..., indent=2))
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+            f.write('[')
+            for i, result in enumerate(self.results):
+                record = json.dumps({
+                    'topic': result.topic,
+                    'text_similarity': result.text_similarity,
+                    'similarity_category': result.similarity_category,
+                    'word_count_diff': result.word_count_diff,
+                    'citation_diff': result.citation_diff,
+                    'section_overlap': result.section_overlap,
+                    'key_differences': result.key_differences,
+                    'timestamp': result.timestamp.isoformat(),
+                    **page_metrics_to_dict(result)
+                }, indent=2)
+                f.write(',\n  ' if i else '\n  ')
+                f.write(record.replace('\n', '\n  '))
+            f.write('\n]' if self.results else ']')
 
         print(f"Results saved to: {output_file}")
 
@@ -137,22 +242,26 @@ class ComparisonOrchestrator:
 
         print("\nGenerating reports...")
 
-        # Summary report
-        self.report_generator.generate_summary_report(self.results)
-
         # Detailed reports for interesting cases
-        # Most similar
-        most_similar = max(self.results, key=lambda r: r.text_similarity)
+        most_similar = max(self.results, key=attrgetter('text_similarity'))
+        most_different = min(self.results, key=attrgetter('text_similarity'))
         print(f"Generating detailed report for most similar: {most_similar.topic}")
-        self.report_generator.generate_detailed_report(most_similar)
-
-        # Most different
-        most_different = min(self.results, key=lambda r: r.text_similarity)
         print(f"Generating detailed report for most different: {most_different.topic}")
-        self.report_generator.generate_detailed_report(most_different)
 
-        # JSON export
-        self.report_generator.export_json(self.results)
+        # Each report renders and writes its own file, so they can run concurrently
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [
+                executor.submit(self.report_generator.generate_summary_report, self.results),
+                executor.submit(self.report_generator.generate_detailed_report, most_similar),
+                executor.submit(self.report_generator.export_json, self.results)
+            ]
+            if most_different is not most_similar:
+                futures.append(
+                    executor.submit(self.report_generator.generate_detailed_report, most_different)
+                )
+
+            for future in futures:
+                future.result()
 
         print("\nAll reports generated successfully!")
 
@@ -182,6 +291,24 @@ def main():
         help='Path to configuration file'
     )
 
+    parser.add_argument(
+        '-j', '--max-concurrency',
+        type=int,
+        default=4,
+        help='Maximum number of topics fetched concurrently (default: 4)'
+    )
+
+    parser.add_argument(
+        '--cache-dir',
+        help='Cache downloaded pages in this directory and revalidate them on later runs'
+    )
+
+    parser.add_argument(
+        '--analyze',
+        action='store_true',
+        help='Calculate quality and bias metrics for every compared page'
+    )
+
     parser.add_argument(
         '--no-reports',
         action='store_true',
@@ -197,15 +324,20 @@ def main():
     args = parser.parse_args()
 
     # Create orchestrator
-    orchestrator = ComparisonOrchestrator(config_path=args.config)
+    orchestrator = ComparisonOrchestrator(config_path=args.config, cache_dir=args.cache_dir)
 
     try:
         # Run comparison
         orchestrator.run_comparison(
             sample_size=args.num_samples,
-            topics=args.topics
+            topics=args.topics,
+            max_concurrency=args.max_concurrency
         )
 
+        # Calculate page metrics
+        if args.analyze:
+            orchestrator.analyze_results()
+
         # Save results
         orchestrator.save_results(args.output)
 
@@ -2,10 +2,18 @@
 Metrics analyzer for calculating quality and bias metrics
 """
 
-from typing import Dict, List
-from dataclasses import dataclass
+from collections import OrderedDict
+from typing import Dict, List, Tuple
+from dataclasses import dataclass, field, replace
 import re
 
+import numpy as np
+
+try:
+    import ahocorasick
+except ImportError:  # Optional C extension; fall back to str.count scans
+    ahocorasick = None
+
 
 @dataclass
 class QualityMetrics:
@@ -26,30 +34,123 @@ class BiasMetrics:
     hedge_words_count: int = 0
 
 
+# Non-ASCII whitespace (e.g. no-break space) mapped to a plain space, so that
+# word boundaries in the ASCII byte buffer match str.split().
+# All Unicode whitespace lies below U+3001.
+_UNICODE_SPACE_TO_ASCII = {
+    code: ' ' for code in range(128, 0x3001) if chr(code).isspace()
+}
+
+# Byte lookup tables for the ASCII buffer (indexing is cheaper than np.isin)
+_SPACE_LUT = np.array([chr(c).isspace() for c in range(256)], dtype=bool)
+_SPACE_LUT[128:] = False  # Only '?' replacements and ASCII reach the buffer
+_VOWEL_LUT = np.zeros(256, dtype=bool)
+_VOWEL_LUT[np.frombuffer(b'aeiouy', dtype=np.uint8)] = True
+
+# Below this length the per-word loop beats the NumPy setup cost
+_VECTORIZE_MIN_CHARS = 2000
+
+# Sentence terminators, and word runs inside sentences (words never span a terminator)
+_SENT_RE = re.compile(r'[.!?]+')
+_SENTENCE_WORD_RE = re.compile(r'[^\s.!?]+')
+
+# First character of each whitespace-delimited word (counts words like
+# len(text.split()) without materializing the word list)
+_WORD_START_RE = re.compile(r'(?<!\S)\S')
+
+
+@dataclass
+class _TextStats:
+    """Tokenization results shared by all quality metrics (computed once per text)"""
+    sentences: List[str] = field(default_factory=list)
+    sentence_word_sum: int = 0
+    word_count: int = 0
+    total_chars: int = 0
+    total_syllables: int = 0
+
+    @property
+    def sentence_count(self) -> int:
+        return len(self.sentences)
+
+
 class MetricsAnalyzer:
     """
     Analyzes pages to calculate quality and bias metrics.
     """
 
     # Loaded language indicators (words that may indicate bias)
-    LOADED_WORDS = [
+    LOADED_WORDS = (
         'obviously', 'clearly', 'undoubtedly', 'certainly', 'definitely',
         'notorious', 'infamous', 'brilliant', 'terrible', 'amazing',
         'incredible', 'outrageous', 'shocking', 'stunning', 'remarkable'
-    ]
+    )
 
     # Hedge words (may indicate uncertainty or weasel words)
-    HEDGE_WORDS = [
+    HEDGE_WORDS = (
         'some say', 'many believe', 'it is said', 'allegedly', 'reportedly',
         'supposedly', 'arguably', 'possibly', 'perhaps', 'maybe',
         'some people', 'critics argue', 'supporters claim'
-    ]
+    )
 
     # First person pronouns
-    FIRST_PERSON = ['i', 'me', 'my', 'mine', 'we', 'us', 'our', 'ours']
+    FIRST_PERSON = ('i', 'me', 'my', 'mine', 'we', 'us', 'our', 'ours')
+
+    # Sentiment indicators (used by the simple polarity estimate)
+    POSITIVE_WORDS = (
+        'good', 'great', 'excellent', 'positive', 'successful', 'beneficial',
+        'important', 'significant', 'valuable', 'notable', 'remarkable',
+        'innovative', 'leading', 'prominent', 'influential'
+    )
+
+    NEGATIVE_WORDS = (
+        'bad', 'poor', 'negative', 'failed', 'harmful', 'detrimental',
+        'insignificant', 'minor', 'controversial', 'criticized', 'disputed',
+        'questionable', 'problematic', 'flawed', 'inferior'
+    )
+
+    def __init__(self, cache_size: int = 128):
+        """
+        Initialize the analyzer.
 
-    def __init__(self):
-        pass
+        Args:
+            cache_size: Number of recent quality metric results to keep
+        """
+        self.cache_size = cache_size
+        self._quality_cache: "OrderedDict[Tuple[str, int], QualityMetrics]" = OrderedDict()
+
+        # Phrase lists matched as substrings of the lowercased text, by category
+        self._phrase_categories = {
+            'loaded': self.LOADED_WORDS,
+            'hedge': self.HEDGE_WORDS
+        }
+        self._automaton = self._build_automaton() if ahocorasick else None
+
+        # Sentiment words only count as whole words ("bad" must not match "badge")
+        self._positive_re = self._compile_word_alternation(self.POSITIVE_WORDS)
+        self._negative_re = self._compile_word_alternation(self.NEGATIVE_WORDS)
+
+        # Whole whitespace-delimited tokens equal to a first person pronoun
+        self._first_person_re = re.compile(
+            r'(?<!\S)(?:' + '|'.join(map(re.escape, self.FIRST_PERSON)) + r')(?!\S)'
+        )
+
+    @staticmethod
+    def _compile_word_alternation(words) -> re.Pattern:
+        """Compile a regex matching any of the given words on word boundaries"""
+        return re.compile(r'\b(?:' + '|'.join(map(re.escape, words)) + r')\b')
+
+    def _build_automaton(self):
+        """Compile all bias/sentiment phrases into one Aho-Corasick automaton"""
+        phrase_to_categories: Dict[str, List[str]] = {}
+        for category, phrases in self._phrase_categories.items():
+            for phrase in phrases:
+                phrase_to_categories.setdefault(phrase, []).append(category)
+
+        automaton = ahocorasick.Automaton()
+        for phrase, categories in phrase_to_categories.items():
+            automaton.add_word(phrase, tuple(categories))
+        automaton.make_automaton()
+        return automaton
 
     def calculate_quality_metrics(self, text: str, citation_count: int) -> QualityMetrics:
         """
@@ -62,24 +163,38 @@ class MetricsAnalyzer:
         Returns:
             QualityMetrics object
         """
+        if not text:
+            return QualityMetrics()
+
+        # Reuse results for text seen recently (e.g. the same page analyzed twice)
+        key = (text, citation_count)
+        cached = self._quality_cache.get(key)
+        if cached is not None:
+            self._quality_cache.move_to_end(key)
+            return replace(cached)
+
         metrics = QualityMetrics()
 
-        if not text:
-            return metrics
+        # Tokenize once and share the result with every metric
+        stats = self._analyze(text)
 
         # Calculate readability (Flesch Reading Ease approximation)
-        metrics.readability_score = self._calculate_readability(text)
+        metrics.readability_score = self._calculate_readability(stats)
 
         # Calculate citation density
-        word_count = len(text.split())
-        if word_count > 0:
-            metrics.citation_density = (citation_count / word_count) * 1000
+        if stats.word_count > 0:
+            metrics.citation_density = (citation_count / stats.word_count) * 1000
 
         # Calculate average sentence length
-        metrics.avg_sentence_length = self._calculate_avg_sentence_length(text)
+        metrics.avg_sentence_length = self._calculate_avg_sentence_length(stats)
 
         # Calculate complexity (based on avg word length and sentence length)
-        metrics.complexity_score = self._calculate_complexity(text)
+        metrics.complexity_score = self._calculate_complexity(stats, metrics.avg_sentence_length)
+
+        if self.cache_size > 0:
+            self._quality_cache[key] = replace(metrics)
+            if len(self._quality_cache) > self.cache_size:
+                self._quality_cache.popitem(last=False)
 
         return metrics
 
@@ -100,27 +215,19 @@ class MetricsAnalyzer:
 
         text_lower = text.lower()
 
-        # Count loaded language
-        metrics.loaded_language_count = sum(
-            text_lower.count(word) for word in self.LOADED_WORDS
-        )
+        # Count loaded language and hedge words in one sweep
+        phrase_counts = self._count_phrases(text_lower)
+        metrics.loaded_language_count = phrase_counts['loaded']
+        metrics.hedge_words_count = phrase_counts['hedge']
 
         # Count first person usage
-        words = text_lower.split()
-        metrics.first_person_count = sum(
-            words.count(pronoun) for pronoun in self.FIRST_PERSON
-        )
-
-        # Count hedge words
-        metrics.hedge_words_count = sum(
-            text_lower.count(phrase) for phrase in self.HEDGE_WORDS
-        )
+        metrics.first_person_count = len(self._first_person_re.findall(text_lower))
 
         # Simple sentiment polarity (very basic - count positive/negative words)
         metrics.sentiment_polarity = self._calculate_simple_sentiment(text_lower)
 
         # Subjectivity score (based on loaded language and first person usage)
-        total_words = len(words)
+        total_words = len(_WORD_START_RE.findall(text_lower))
         if total_words > 0:
             subjective_indicators = (
                 metrics.loaded_language_count +
@@ -131,55 +238,109 @@ class MetricsAnalyzer:
 
         return metrics
 
-    def _calculate_readability(self, text: str) -> float:
+    def _analyze(self, text: str) -> _TextStats:
         """
-        Calculate Flesch Reading Ease score (approximation).
+        Tokenize text into words and sentences in a single pass.
 
-        Formula: 206.835 - 1.015 * (total_words / total_sentences) - 84.6 * (total_syllables / total_words)
+        Word and syllable totals are computed with NumPy over one byte buffer
+        of the lowercased text instead of a Python loop per word.
+
+        Args:
+            text: Text content to analyze
 
         Returns:
-            Readability score (0-100, higher is easier to read)
+            _TextStats shared by the quality metric helpers
         """
         sentences = self._split_sentences(text)
-        if not sentences:
-            return 0.0
+        stats = _TextStats(
+            sentences=sentences,
+            sentence_word_sum=len(_SENTENCE_WORD_RE.findall(text))
+        )
+
+        if len(text) < _VECTORIZE_MIN_CHARS:
+            # Empty, one-word and stub pages: skip the NumPy setup entirely
+            return self._analyze_words(text, stats)
+
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Rare case where lowercasing changes length: count per word
+            return self._analyze_words(text, stats)
+
+        # One byte per character; non-ASCII characters become '?'
+        if not lowered.isascii():
+            lowered = lowered.translate(_UNICODE_SPACE_TO_ASCII)
+        buf = np.frombuffer(lowered.encode('ascii', 'replace'), dtype=np.uint8)
+
+        in_word = ~_SPACE_LUT[buf]
+        starts = np.flatnonzero(in_word & ~np.concatenate(([False], in_word[:-1])))
+        if starts.size == 0:
+            return stats
+        ends = np.flatnonzero(in_word & ~np.concatenate((in_word[1:], [False])))
+
+        # A syllable starts at each vowel not preceded by another vowel
+        vowel = _VOWEL_LUT[buf]
+        group_start = vowel & ~np.concatenate(([False], vowel[:-1]))
 
+        syllables = np.add.reduceat(group_start.astype(np.int64), starts)
+        syllables -= buf[ends] == ord('e')  # Silent 'e'
+
+        stats.word_count = int(starts.size)
+        stats.total_chars = int(np.count_nonzero(in_word))
+        stats.total_syllables = int(np.maximum(syllables, 1).sum())
+        return stats
+
+    def _analyze_words(self, text: str, stats: _TextStats) -> _TextStats:
+        """Fill word, character and syllable totals with a per-word loop"""
         words = text.split()
-        total_words = len(words)
-        total_sentences = len(sentences)
+        if not words:
+            return stats
+
+        stats.word_count = len(words)
+        stats.total_chars = sum(map(len, words))
+        stats.total_syllables = sum(map(self._count_syllables, words))
+        return stats
+
+    def _calculate_readability(self, stats: _TextStats) -> float:
+        """
+        Calculate Flesch Reading Ease score (approximation).
+
+        Formula: 206.835 - 1.015 * (total_words / total_sentences) - 84.6 * (total_syllables / total_words)
+
+        Returns:
+            Readability score (0-100, higher is easier to read)
+        """
+        total_words = stats.word_count
+        total_sentences = stats.sentence_count
 
         if total_words == 0 or total_sentences == 0:
             return 0.0
 
-        # Approximate syllables (very rough estimate)
-        total_syllables = sum(self._count_syllables(word) for word in words)
-
         # Flesch Reading Ease formula
-        score = 206.835 - 1.015 * (total_words / total_sentences) - 84.6 * (total_syllables / total_words)
+        score = 206.835 - 1.015 * (total_words / total_sentences) - 84.6 * (stats.total_syllables / total_words)
 
         return max(0.0, min(100.0, score))
 
-    def _calculate_avg_sentence_length(self, text: str) -> float:
+    def _calculate_avg_sentence_length(self, stats: _TextStats) -> float:
         """Calculate average sentence length in words"""
-        sentences = self._split_sentences(text)
-        if not sentences:
+        if not stats.sentences:
             return 0.0
 
-        total_words = sum(len(sentence.split()) for sentence in sentences)
-        return total_words / len(sentences)
+        return stats.sentence_word_sum / stats.sentence_count
 
-    def _calculate_complexity(self, text: str) -> float:
+    def _calculate_complexity(self, stats: _TextStats, avg_sentence_length: float) -> float:
         """
         Calculate text complexity score (0-1).
 
         Based on average word length and sentence length.
+
+        Args:
+            stats: Tokenization results for the text
+            avg_sentence_length: Precomputed average sentence length in words
         """
-        words = text.split()
-        if not words:
+        if stats.word_count == 0:
             return 0.0
 
-        avg_word_length = sum(len(word) for word in words) / len(words)
-        avg_sentence_length = self._calculate_avg_sentence_length(text)
+        avg_word_length = stats.total_chars / stats.word_count
 
         # Normalize to 0-1 scale
         word_complexity = min(avg_word_length / 10, 1.0)  # 10+ chars is complex
@@ -190,8 +351,7 @@ class MetricsAnalyzer:
     def _split_sentences(self, text: str) -> List[str]:
         """Split text into sentences"""
         # Simple sentence splitting
-        sentences = re.split(r'[.!?]+', text)
-        return [s.strip() for s in sentences if s.strip()]
+        return [s for sentence in _SENT_RE.split(text) if (s := sentence.strip())]
 
     def _count_syllables(self, word: str) -> int:
         """
@@ -217,26 +377,36 @@ class MetricsAnalyzer:
         # Every word has at least one syllable
         return max(1, syllable_count)
 
+    def _count_phrases(self, text_lower: str) -> Dict[str, int]:
+        """
+        Count substring occurrences of every phrase category in lowercased text.
+
+        Uses a single Aho-Corasick pass when pyahocorasick is installed,
+        otherwise one str.count scan per phrase.
+
+        Returns:
+            Dictionary mapping category name to total occurrences
+        """
+        counts = dict.fromkeys(self._phrase_categories, 0)
+
+        if self._automaton is not None:
+            for _, categories in self._automaton.iter(text_lower):
+                for category in categories:
+                    counts[category] += 1
+        else:
+            for category, phrases in self._phrase_categories.items():
+                counts[category] = sum(text_lower.count(phrase) for phrase in phrases)
+
+        return counts
+
     def _calculate_simple_sentiment(self, text: str) -> float:
         """
         Calculate simple sentiment polarity (-1 to 1).
 
         This is a very basic implementation. For production, use a proper sentiment analysis library.
         """
-        positive_words = [
-            'good', 'great', 'excellent', 'positive', 'successful', 'beneficial',
-            'important', 'significant', 'valuable', 'notable', 'remarkable',
-            'innovative', 'leading', 'prominent', 'influential'
-        ]
-
-        negative_words = [
-            'bad', 'poor', 'negative', 'failed', 'harmful', 'detrimental',
-            'insignificant', 'minor', 'controversial', 'criticized', 'disputed',
-            'questionable', 'problematic', 'flawed', 'inferior'
-        ]
-
-        positive_count = sum(text.count(word) for word in positive_words)
-        negative_count = sum(text.count(word) for word in negative_words)
+        positive_count = len(self._positive_re.findall(text))
+        negative_count = len(self._negative_re.findall(text))
 
         total = positive_count + negative_count
         if total == 0:
@@ -2,19 +2,43 @@
 Page comparison engine for analyzing differences between Grokipedia and Wikipedia pages
 """
 
-import difflib
+import hashlib
+import os
+import re
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 
+import Levenshtein
 from diff_match_patch import diff_match_patch
 
 from ..scrapers.base_scraper import PageContent
 
 
+# Texts longer than this are diffed word by word instead of character by character
+WORD_DIFF_THRESHOLD = 10000
+
+# Diff tokens: a word with its trailing whitespace, or leading whitespace.
+# Concatenating the tokens of a text reproduces it exactly.
+_DIFF_TOKEN_RE = re.compile(r'\s+|\S+\s*')
+
+# diff-match-patch operation -> (segment type, text in Grokipedia, text in Wikipedia).
+# Deletions are in Wikipedia but not Grokipedia, insertions the reverse.
+_DIFF_ATTRS = {
+    0: ('equal', True, True),
+    -1: ('delete', False, True),
+    1: ('insert', True, False),
+}
+
+
 @dataclass
 class DiffSegment:
     """Represents a segment of text difference"""
+    # No per-instance __dict__: up to 100 segments are kept per comparison
+    __slots__ = ('type', 'grokipedia_text', 'wikipedia_text', 'position')
+
     type: str  # 'equal', 'insert', 'delete', 'replace'
     grokipedia_text: str
     wikipedia_text: str
@@ -62,13 +86,49 @@ class ComparisonResult:
     timestamp: datetime = field(default_factory=datetime.now)
 
 
+# Comparator reused by every task that runs in the same worker process
+_worker_comparator: Optional["PageComparator"] = None
+
+
+def _compare_pair(pair: Tuple[PageContent, PageContent]) -> "ComparisonResult":
+    """
+    Compare one page pair in a worker process.
+
+    The pages are detached from the returned result so they aren't pickled
+    back to the parent, which already holds them.
+
+    Args:
+        pair: (Grokipedia page, Wikipedia page)
+
+    Returns:
+        ComparisonResult without its page references
+    """
+    global _worker_comparator
+    if _worker_comparator is None:
+        _worker_comparator = PageComparator()
+
+    result = _worker_comparator.compare(*pair)
+    result.grokipedia_page = None
+    result.wikipedia_page = None
+    return result
+
+
 class PageComparator:
     """
     Compares Grokipedia and Wikipedia pages to identify differences and similarities.
     """
 
-    def __init__(self):
+    def __init__(self, cache_size: int = 512):
+        """
+        Initialize the comparator.
+
+        Args:
+            cache_size: Number of recent text pairs whose similarity, edit
+                distance and diff segments are kept
+        """
         self.dmp = diff_match_patch()
+        self.cache_size = cache_size
+        self._text_cache: "OrderedDict[Tuple[bytes, bytes], Tuple[float, int, List[DiffSegment]]]" = OrderedDict()
 
     def compare(self, grokipedia_page: PageContent, wikipedia_page: PageContent) -> ComparisonResult:
         """
@@ -87,23 +147,12 @@ class PageComparator:
             wikipedia_page=wikipedia_page
         )
 
-        # Calculate text similarity
-        result.text_similarity = self._calculate_text_similarity(
-            grokipedia_page.text_content,
-            wikipedia_page.text_content
-        )
-
-        # Calculate Levenshtein distance (limited to avoid performance issues)
-        result.levenshtein_distance = self._calculate_levenshtein_distance(
-            grokipedia_page.text_content[:10000],
-            wikipedia_page.text_content[:10000]
-        )
-
-        # Generate diff segments
-        result.diff_segments = self._generate_diff_segments(
-            grokipedia_page.text_content,
-            wikipedia_page.text_content
-        )
+        # Text similarity, Levenshtein distance and diff segments
+        (
+            result.text_similarity,
+            result.levenshtein_distance,
+            result.diff_segments
+        ) = self._compare_texts(grokipedia_page, wikipedia_page)
 
         # Content metrics
         result.word_count_diff = grokipedia_page.word_count - wikipedia_page.word_count
@@ -127,8 +176,8 @@ class PageComparator:
         )
 
         # Structural metrics
-        result.citation_count_grokipedia = len(grokipedia_page.citations)
-        result.citation_count_wikipedia = len(wikipedia_page.citations)
+        result.citation_count_grokipedia = grokipedia_page.citation_count
+        result.citation_count_wikipedia = wikipedia_page.citation_count
         result.citation_diff = result.citation_count_grokipedia - result.citation_count_wikipedia
 
         result.has_infobox_grokipedia = grokipedia_page.infobox is not None
@@ -150,13 +199,109 @@ class PageComparator:
 
         return result
 
-    def _calculate_text_similarity(self, text1: str, text2: str) -> float:
+    def compare_many(self, pairs: List[Tuple[PageContent, PageContent]],
+                     max_workers: Optional[int] = None) -> List[ComparisonResult]:
         """
-        Calculate similarity ratio between two texts using SequenceMatcher.
+        Compare many page pairs, spreading larger batches across processes.
+
+        Comparison is CPU-bound and independent per pair, so batches of four
+        or more pairs run in a process pool. Only what the comparison needs
+        is sent to the workers (raw HTML is dropped), and each result is
+        re-attached to the caller's original pages.
+
+        Args:
+            pairs: (Grokipedia page, Wikipedia page) tuples
+            max_workers: Number of worker processes (default: CPU count)
+
+        Returns:
+            ComparisonResult for each pair, in order
+        """
+        # Pool startup isn't worth it for a handful of pairs
+        if len(pairs) < 4:
+            return [self.compare(grok_page, wiki_page) for grok_page, wiki_page in pairs]
+
+        jobs = [
+            (replace(grok_page, raw_html=None), replace(wiki_page, raw_html=None))
+            for grok_page, wiki_page in pairs
+        ]
+
+        workers = max_workers or os.cpu_count() or 1
+        chunksize = max(1, min(4, len(jobs) // workers))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            results = list(executor.map(_compare_pair, jobs, chunksize=chunksize))
+
+        for result, (grok_page, wiki_page) in zip(results, pairs):
+            result.grokipedia_page = grok_page
+            result.wikipedia_page = wiki_page
+
+        return results
+
+    def _compare_texts(self, page1: PageContent, page2: PageContent) -> Tuple[float, int, List[DiffSegment]]:
+        """
+        Calculate the text-derived metrics for a pair of pages, with caching.
+
+        Re-running a comparison for the same pair of texts (e.g. a repeated
+        run over the same topics) reuses the earlier results instead of
+        re-diffing. Entries are keyed on content digests so the cache does
+        not keep full article texts alive.
+
+        Args:
+            page1: Grokipedia page
+            page2: Wikipedia page
+
+        Returns:
+            Tuple of (text similarity, Levenshtein distance, diff segments)
+        """
+        text1 = page1.text_content
+        text2 = page2.text_content
+
+        key = (self._digest(text1), self._digest(text2))
+        cached = self._text_cache.get(key)
+        if cached is not None:
+            self._text_cache.move_to_end(key)
+        elif text1 == text2:
+            # Identical texts (e.g. a page mirrored from Wikipedia): nothing to diff
+            cached = (
+                1.0 if text1 else 0.0,
+                0,
+                [DiffSegment('equal', text1[:500], text1[:500], 0)] if text1 else []
+            )
+        else:
+            # Pages keep their lowercased text, so a page compared against
+            # several others is only lowercased once
+            cached = (
+                self._calculate_text_similarity(page1.text_lower, page2.text_lower, lowered=True),
+                self._calculate_levenshtein_distance(text1, text2),
+                self._generate_diff_segments(text1, text2)
+            )
+            if self.cache_size > 0:
+                self._text_cache[key] = cached
+                if len(self._text_cache) > self.cache_size:
+                    self._text_cache.popitem(last=False)
+
+        similarity, distance, segments = cached
+        # Copy segments so callers can't modify the cached entry
+        return similarity, distance, [replace(segment) for segment in segments]
+
+    @staticmethod
+    def _digest(text: str) -> bytes:
+        """Return a compact content digest used as a cache key"""
+        return hashlib.blake2b(text.encode('utf-8', 'surrogatepass'), digest_size=16).digest()
+
+    def _calculate_text_similarity(self, text1: str, text2: str, lowered: bool = False) -> float:
+        """
+        Calculate similarity ratio between two texts.
+
+        Uses the normalized Indel similarity, 1 - indel_distance / (len1 + len2),
+        computed by python-Levenshtein's bit-parallel C implementation. Unlike
+        difflib's SequenceMatcher (Ratcliff-Obershelp matching blocks), this is
+        based on the longest common subsequence, so scores can differ slightly
+        for heavily reordered texts.
 
         Args:
             text1: First text
             text2: Second text
+            lowered: Whether both texts are already lowercase
 
         Returns:
             Similarity ratio (0.0 to 1.0)
@@ -164,9 +309,14 @@ class PageComparator:
         if not text1 or not text2:
             return 0.0
 
-        # Use difflib's SequenceMatcher for similarity
-        matcher = difflib.SequenceMatcher(None, text1.lower(), text2.lower())
-        return matcher.ratio()
+        if text1 is text2 or text1 == text2:
+            return 1.0
+
+        if not lowered:
+            text1 = text1.lower()
+            text2 = text2.lower()
+
+        return Levenshtein.ratio(text1, text2)
 
     def _calculate_levenshtein_distance(self, text1: str, text2: str) -> int:
         """
@@ -179,10 +329,9 @@ class PageComparator:
         Returns:
             Edit distance
         """
-        # Simple implementation using difflib
-        # For production, consider using python-Levenshtein library
-        diffs = self.dmp.diff_main(text1[:10000], text2[:10000])
-        return self.dmp.diff_levenshtein(diffs)
+        # python-Levenshtein uses a bit-parallel C implementation, so the exact
+        # distance is cheap even at the 10000 character limit
+        return Levenshtein.distance(text1[:10000], text2[:10000])
 
     def _generate_diff_segments(self, text1: str, text2: str, max_segments: int = 100) -> List[DiffSegment]:
         """
@@ -196,30 +345,26 @@ class PageComparator:
         Returns:
             List of DiffSegment objects
         """
-        diffs = self.dmp.diff_main(text1, text2)
+        if len(text1) > WORD_DIFF_THRESHOLD or len(text2) > WORD_DIFF_THRESHOLD:
+            diffs = self._diff_words(text1, text2)
+        else:
+            diffs = self.dmp.diff_main(text1, text2)
         self.dmp.diff_cleanupSemantic(diffs)
 
         segments = []
         position = 0
 
-        for diff_type, text in diffs[:max_segments]:
-            if diff_type == 0:  # Equal
-                segment_type = 'equal'
-                grok_text = text
-                wiki_text = text
-            elif diff_type == -1:  # Deletion (in Wikipedia but not Grokipedia)
-                segment_type = 'delete'
-                grok_text = ""
-                wiki_text = text
-            else:  # Insertion (in Grokipedia but not Wikipedia)
-                segment_type = 'insert'
-                grok_text = text
-                wiki_text = ""
+        for index, (diff_type, text) in enumerate(diffs):
+            if index >= max_segments:
+                break
+
+            segment_type, in_grokipedia, in_wikipedia = _DIFF_ATTRS[diff_type]
+            snippet = text[:500]  # Limit length
 
             segments.append(DiffSegment(
                 type=segment_type,
-                grokipedia_text=grok_text[:500],  # Limit length
-                wikipedia_text=wiki_text[:500],
+                grokipedia_text=snippet if in_grokipedia else "",
+                wikipedia_text=snippet if in_wikipedia else "",
                 position=position
             ))
 
@@ -227,6 +372,44 @@ class PageComparator:
 
         return segments
 
+    def _diff_words(self, text1: str, text2: str) -> List[Tuple[int, str]]:
+        """
+        Diff two texts at word granularity.
+
+        Scraped article text is whitespace-joined onto a single line, so
+        diff-match-patch's line mode has nothing to work with. Instead each
+        distinct word token is encoded as one character, the much shorter
+        encoded strings are diffed, and the result is expanded back to text.
+        Character level diffs of full articles tend to hit Diff_Timeout and
+        come back as a few coarse replacements.
+
+        Args:
+            text1: Grokipedia text
+            text2: Wikipedia text
+
+        Returns:
+            diff-match-patch diff tuples over the original texts
+        """
+        token_array = ['']  # Index 0 is unused, as in diff_linesToChars
+        token_index: Dict[str, int] = {}
+
+        def encode(text: str) -> str:
+            chars = []
+            for token in _DIFF_TOKEN_RE.findall(text):
+                index = token_index.get(token)
+                if index is None:
+                    index = token_index[token] = len(token_array)
+                    token_array.append(token)
+                chars.append(chr(index))
+            return ''.join(chars)
+
+        chars1 = encode(text1)
+        chars2 = encode(text2)
+
+        diffs = self.dmp.diff_main(chars1, chars2, False)
+        self.dmp.diff_charsToLines(diffs, token_array)
+        return diffs
+
     def _calculate_section_overlap(self, sections1: Dict[str, str], sections2: Dict[str, str]) -> float:
         """
         Calculate Jaccard similarity of section titles.
@@ -241,11 +424,9 @@ class PageComparator:
         if not sections1 or not sections2:
             return 0.0
 
-        set1 = set(sections1.keys())
-        set2 = set(sections2.keys())
-
-        intersection = len(set1 & set2)
-        union = len(set1 | set2)
+        # Dict key views support set operations without building sets
+        intersection = len(sections1.keys() & sections2.keys())
+        union = len(sections1) + len(sections2) - intersection
 
         return intersection / union if union > 0 else 0.0
 
@@ -260,9 +441,7 @@ class PageComparator:
         Returns:
             List of unique section titles
         """
-        set1 = set(sections1.keys())
-        set2 = set(sections2.keys())
-        return sorted(list(set1 - set2))
+        return sorted(sections1.keys() - sections2.keys())
 
     def _categorize_similarity(self, similarity: float) -> str:
         """
@@ -294,20 +473,22 @@ class PageComparator:
         differences = []
 
         # Length difference
-        if abs(result.word_count_diff_pct) > 25:
+        length_pct = abs(result.word_count_diff_pct)
+        if length_pct > 25:
             if result.word_count_diff > 0:
                 differences.append(
-                    f"Grokipedia version is {abs(result.word_count_diff_pct):.1f}% longer "
+                    f"Grokipedia version is {length_pct:.1f}% longer "
                     f"({result.grokipedia_page.word_count} vs {result.wikipedia_page.word_count} words)"
                 )
             else:
                 differences.append(
-                    f"Wikipedia version is {abs(result.word_count_diff_pct):.1f}% longer "
+                    f"Wikipedia version is {length_pct:.1f}% longer "
                     f"({result.wikipedia_page.word_count} vs {result.grokipedia_page.word_count} words)"
                 )
 
         # Citation difference
-        if abs(result.citation_diff) > 5:
+        citation_gap = abs(result.citation_diff)
+        if citation_gap > 5:
             if result.citation_diff > 0:
                 differences.append(
                     f"Grokipedia has {result.citation_diff} more citations "
@@ -315,7 +496,7 @@ class PageComparator:
                 )
             else:
                 differences.append(
-                    f"Wikipedia has {abs(result.citation_diff)} more citations "
+                    f"Wikipedia has {citation_gap} more citations "
                     f"({result.citation_count_wikipedia} vs {result.citation_count_grokipedia})"
                 )
 
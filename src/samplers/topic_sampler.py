@@ -2,21 +2,40 @@
 Topic Sampler for selecting representative pages from Grokipedia and Wikipedia
 """
 
+import copy
 import random
 import yaml
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Tuple
 from dataclasses import dataclass
 
+# libyaml's C loader when PyYAML was built with it
+_YamlLoader = getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
 
 @dataclass
 class SamplingCategory:
     """Represents a category of topics for sampling"""
+    __slots__ = ('name', 'weight', 'topics')
+
     name: str
     weight: float
     topics: List[str]
 
 
+@lru_cache(maxsize=8)
+def _load_config_cached(path: str, mtime_ns: int) -> Dict:
+    """
+    Parse a YAML config file, cached per path and modification time.
+
+    The modification time is part of the key, so edited files are re-read.
+    Callers must copy the result before modifying it.
+    """
+    with open(path, 'r') as f:
+        return yaml.load(f, Loader=_YamlLoader)
+
+
 class TopicSampler:
     """
     Implements stratified sampling strategy to select representative topics
@@ -33,12 +52,14 @@ class TopicSampler:
         self.config_path = Path(config_path)
         self.config = self._load_config()
         self.random_seed = self.config['sampling'].get('random_seed', 42)
-        random.seed(self.random_seed)
+        # Own generator: don't reseed (or get disturbed by) the global random module
+        self._rng = random.Random(self.random_seed)
 
     def _load_config(self) -> Dict:
         """Load configuration from YAML file"""
-        with open(self.config_path, 'r') as f:
-            return yaml.safe_load(f)
+        mtime_ns = self.config_path.stat().st_mtime_ns
+        # Deep copy: add_custom_topic modifies the config in place
+        return copy.deepcopy(_load_config_cached(str(self.config_path), mtime_ns))
 
     def get_categories(self) -> List[SamplingCategory]:
         """Extract sampling categories from configuration"""
@@ -77,10 +98,10 @@ class TopicSampler:
 
             # Sample topics (with replacement if needed)
             if len(category.topics) >= category_sample_size:
-                sampled = random.sample(category.topics, category_sample_size)
+                sampled = self._rng.sample(category.topics, category_sample_size)
             else:
                 # If we need more samples than available, use all + random repeats
-                sampled = category.topics + random.choices(
+                sampled = category.topics + self._rng.choices(
                     category.topics,
                     k=category_sample_size - len(category.topics)
                 )
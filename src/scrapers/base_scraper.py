@@ -2,13 +2,62 @@
 Base scraper class for extracting content from wiki-style pages
 """
 
+import asyncio
+import hashlib
+import json
+import logging
+import os
+import threading
 import time
 import requests
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from abc import ABC, abstractmethod
 from typing import Dict, Optional, List
 from dataclasses import dataclass, field
+from functools import cached_property
 from datetime import datetime
-from bs4 import BeautifulSoup
+from pathlib import Path
+from bs4 import Tag
+from lxml import etree
+from lxml import html as lxml_html
+
+logger = logging.getLogger(__name__)
+
+# Elements whose text is not part of the rendered article. BeautifulSoup's
+# get_text() skipped their strings; blanking them once after parsing lets
+# every extractor use lxml's C-level text_content() instead.
+_NON_TEXT_TAGS = ('script', 'style', 'template', 'rt', 'rp')
+
+
+def _blank_non_text(tree) -> None:
+    """Drop the text inside _NON_TEXT_TAGS elements, keeping their tails"""
+    for elem in tree.iter(*_NON_TEXT_TAGS):
+        elem.text = None
+        for child in elem.iterdescendants():
+            child.text = None
+            child.tail = None
+
+
+class _LazyWordCount:
+    """
+    Data descriptor behind PageContent.word_count.
+
+    A count passed to the constructor is kept as is; 0 (the default) means
+    the words are counted on first access instead of for every page.
+    """
+
+    def __get__(self, obj, objtype=None) -> int:
+        if obj is None:  # Class access: the dataclass field default
+            return 0
+        count = obj.__dict__.get('_word_count')
+        if count is None:
+            count = obj.__dict__['_word_count'] = len(obj.text_content.split())
+        return count
+
+    def __set__(self, obj, value: int):
+        obj.__dict__['_word_count'] = value or None
 
 
 @dataclass
@@ -16,7 +65,7 @@ class PageContent:
     """Structured representation of a wiki page"""
     title: str
     url: str
-    raw_html: str
+    raw_html: Optional[str]  # None unless the scraper was created with keep_raw_html
     text_content: str
     sections: Dict[str, str] = field(default_factory=dict)
     citations: List[Dict] = field(default_factory=list)
@@ -25,13 +74,18 @@ class PageContent:
     external_links: List[str] = field(default_factory=list)
     categories: List[str] = field(default_factory=list)
     last_modified: Optional[datetime] = None
-    word_count: int = 0
+    word_count: int = _LazyWordCount()
     metadata: Dict = field(default_factory=dict)
+    citation_count: int = field(init=False, default=0)
 
     def __post_init__(self):
-        """Calculate word count after initialization"""
-        if self.word_count == 0 and self.text_content:
-            self.word_count = len(self.text_content.split())
+        """Calculate citation count after initialization"""
+        self.citation_count = len(self.citations)
+
+    @cached_property
+    def text_lower(self) -> str:
+        """Lowercased text content, computed once per page"""
+        return self.text_content.lower()
 
 
 class BaseScraper(ABC):
@@ -40,55 +94,140 @@ class BaseScraper(ABC):
     Provides common functionality for rate limiting and error handling.
     """
 
-    def __init__(self, rate_limit_delay: float = 2.0, max_retries: int = 3, timeout: int = 30):
+    def __init__(self, rate_limit_delay: float = 2.0, max_retries: int = 3, timeout: int = 30,
+                 cache_dir: Optional[str] = None, cache_ttl: float = 86400,
+                 keep_raw_html: bool = False):
         """
         Initialize the scraper.
 
         Args:
             rate_limit_delay: Delay in seconds between requests
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts per request, counting the
+                first one (so 3 means up to 2 retries)
             timeout: Request timeout in seconds
+            cache_dir: Directory for an on-disk page cache (disabled if None)
+            cache_ttl: Seconds a cached page is used without contacting the server
+            keep_raw_html: Keep each page's source HTML on PageContent.raw_html.
+                Off by default, since the HTML is usually several times the size
+                of everything parsed out of it; with cache_dir set the source
+                stays on disk regardless.
         """
         self.rate_limit_delay = rate_limit_delay
         self.max_retries = max_retries
         self.timeout = timeout
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_ttl = cache_ttl
+        self.keep_raw_html = keep_raw_html
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.session = requests.Session()
+
+        # Retries with jittered exponential backoff (honouring Retry-After)
+        # happen inside the connection pool, for page and API requests alike
+        retry = Retry(
+            total=max(0, max_retries - 1),
+            backoff_factor=1.0,
+            backoff_jitter=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            respect_retry_after_header=True,
+            raise_on_status=False
+        )
+        adapter = HTTPAdapter(max_retries=retry, pool_connections=8, pool_maxsize=16)
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Research Project) GrokipediaComparison/1.0'
         })
         self.last_request_time = 0
+        self._rate_limit_lock = threading.Lock()
 
     def _rate_limit(self):
-        """Enforce rate limiting between requests"""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.rate_limit_delay:
-            time.sleep(self.rate_limit_delay - elapsed)
-        self.last_request_time = time.time()
+        """Enforce rate limiting between requests (safe to call from multiple threads)"""
+        with self._rate_limit_lock:
+            elapsed = time.time() - self.last_request_time
+            if elapsed < self.rate_limit_delay:
+                time.sleep(self.rate_limit_delay - elapsed)
+            self.last_request_time = time.time()
 
     def _fetch_page(self, url: str) -> Optional[str]:
         """
         Fetch a page with retry logic and rate limiting.
 
+        Connection errors and 429/5xx responses are retried by the session's
+        adapter, up to max_retries attempts in total.
+
+        With a cache_dir, pages fetched less than cache_ttl seconds ago are
+        served from disk. Older entries are revalidated with their ETag /
+        Last-Modified, so an unchanged page costs a 304 without a body.
+
         Args:
             url: URL to fetch
 
         Returns:
             HTML content or None if failed
         """
+        cached = self._read_cache(url) if self.cache_dir else None
+        if cached and time.time() - cached['fetched_at'] < self.cache_ttl:
+            return cached['body']
+
+        headers = {}
+        if cached:
+            if cached.get('etag'):
+                headers['If-None-Match'] = cached['etag']
+            if cached.get('last_modified'):
+                headers['If-Modified-Since'] = cached['last_modified']
+
         self._rate_limit()
 
-        for attempt in range(self.max_retries):
-            try:
-                response = self.session.get(url, timeout=self.timeout)
-                response.raise_for_status()
-                return response.text
-            except requests.RequestException as e:
-                print(f"Attempt {attempt + 1}/{self.max_retries} failed for {url}: {e}")
-                if attempt < self.max_retries - 1:
-                    time.sleep(2 ** attempt)  # Exponential backoff
-                else:
-                    print(f"Failed to fetch {url} after {self.max_retries} attempts")
-                    return None
+        try:
+            response = self.session.get(url, timeout=self.timeout, headers=headers)
+            if cached and response.status_code == 304:
+                self._write_cache(url, cached['body'], cached.get('etag'), cached.get('last_modified'))
+                return cached['body']
+            response.raise_for_status()
+        except requests.RequestException as e:
+            logger.error("Failed to fetch %s: %s", url, e)
+            return None
+
+        if self.cache_dir:
+            self._write_cache(url, response.text, response.headers.get('ETag'),
+                              response.headers.get('Last-Modified'))
+        return response.text
+
+    def _cache_path(self, url: str) -> Path:
+        """Path of the cache entry for a URL"""
+        return self.cache_dir / (hashlib.sha256(url.encode('utf-8')).hexdigest() + '.json')
+
+    def _read_cache(self, url: str) -> Optional[Dict]:
+        """Load the cache entry for a URL, or None if missing or unreadable"""
+        try:
+            with open(self._cache_path(url), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        # Entries without a body or timestamp (not written by _write_cache) are misses
+        if not isinstance(entry, dict) or 'body' not in entry or 'fetched_at' not in entry:
+            return None
+        return entry
+
+    def _write_cache(self, url: str, body: str, etag: Optional[str], last_modified: Optional[str]):
+        """Store a page with its validators (atomically, as fetch threads may race)"""
+        path = self._cache_path(url)
+        tmp_path = path.with_name(f"{path.name}.{threading.get_ident()}.tmp")
+        entry = {
+            'url': url,
+            'etag': etag,
+            'last_modified': last_modified,
+            'fetched_at': time.time(),
+            'body': body
+        }
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not cache %s: %s", url, e)
 
     @abstractmethod
     def get_page_url(self, topic: str) -> str:
@@ -135,10 +274,51 @@ class BaseScraper(ABC):
 
         return self.parse_page(html, url)
 
+    async def afetch_and_parse(self, topic: str) -> Optional[PageContent]:
+        """
+        Async variant of fetch_and_parse.
+
+        The blocking fetch runs in the default executor so that requests to
+        different hosts (and different topics) can be in flight at the same
+        time. Rate limiting still applies per scraper instance.
+
+        Args:
+            topic: The topic/page title
+
+        Returns:
+            Parsed PageContent or None if failed
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.fetch_and_parse, topic)
+
+    def scrape_many(self, topics: List[str], max_workers: int = 8) -> List[Optional[PageContent]]:
+        """
+        Fetch and parse several topics using a pool of threads.
+
+        Threads share the session's connection pool. Consecutive requests
+        to this scraper's host are still spaced by rate_limit_delay, so the
+        pool mainly overlaps network latency and parsing. Run one scraper
+        per host to fetch from several hosts in parallel.
+
+        Use this from synchronous code. Code already running an event loop
+        (like the orchestrator) should gather afetch_and_parse calls instead,
+        bounding concurrency on the loop rather than starting another pool.
+
+        Args:
+            topics: Topic/page titles to fetch
+            max_workers: Number of worker threads
+
+        Returns:
+            Parsed PageContent (or None if failed) for each topic, in order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.fetch_and_parse, topics))
+
     @staticmethod
     def extract_text_from_html(html: str) -> str:
         """
-        Extract clean text from HTML, removing scripts and styles.
+        Extract clean text from HTML, skipping the same non-text elements
+        (scripts, styles, templates, ruby annotations) as the page parsers.
 
         Args:
             html: Raw HTML content
@@ -146,18 +326,37 @@ class BaseScraper(ABC):
         Returns:
             Clean text content
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        # Parse with lxml directly: no BeautifulSoup object model is needed
+        # just to drop the non-text elements and read the text
+        try:
+            tree = lxml_html.fromstring(html)
+        except etree.ParserError:  # Empty document
+            return ""
+
+        _blank_non_text(tree)
+
+        return BaseScraper._clean_whitespace(tree.text_content())
+
+    @staticmethod
+    def extract_text_from_tag(tag: Tag) -> str:
+        """
+        Extract clean text from an already parsed BeautifulSoup element.
 
-        # Remove script and style elements
-        for script in soup(["script", "style"]):
-            script.decompose()
+        Avoids serializing the element back to HTML and parsing it again.
+        BeautifulSoup keeps script and style contents as separate string
+        types that get_text() skips, so they are excluded here as well.
 
-        # Get text
-        text = soup.get_text()
+        Args:
+            tag: Parsed element (e.g. the page's content div)
 
-        # Clean up whitespace
+        Returns:
+            Clean text content
+        """
+        return BaseScraper._clean_whitespace(tag.get_text())
+
+    @staticmethod
+    def _clean_whitespace(text: str) -> str:
+        """Strip lines and join the remaining phrases with single spaces"""
         lines = (line.strip() for line in text.splitlines())
         chunks = (phrase.strip() for line in lines for phrase in line.split("  "))
-        text = ' '.join(chunk for chunk in chunks if chunk)
-
-        return text
+        return ' '.join(chunk for chunk in chunks if chunk)
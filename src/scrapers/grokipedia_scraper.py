@@ -6,11 +6,176 @@ import re
 from typing import Dict, List, Optional
 from datetime import datetime
 from urllib.parse import quote
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from .base_scraper import BaseScraper, PageContent
 
 
+# Trailing " - Grokipedia" (or en/em dash) site suffix in page titles
+_GROKIPEDIA_SUFFIX_RE = re.compile(r'\s*[-–—]\s*Grokipedia.*$')
+
+# Headers introducing a list of external sources
+_EXT_LINKS_HEADER_RE = re.compile(r'External [Ll]inks?|References?|Sources?')
+
+# Day-month-year dates like "31 October 2024", captured as (day, month, year)
+_DATE_RE = re.compile(r'(\d{1,2})\s+(\w+)\s+(\d{4})')
+
+# Full English month names (lowercased) to month numbers, so text dates
+# can be built directly instead of going through strptime
+_MONTHS = {
+    'january': 1, 'february': 2, 'march': 3, 'april': 4, 'may': 5, 'june': 6,
+    'july': 7, 'august': 8, 'september': 9, 'october': 10, 'november': 11, 'december': 12,
+}
+
+# Section walk: headings start a section, paragraphs and lists fill it
+_HEADING_NAMES = frozenset({'h1', 'h2', 'h3', 'h4'})
+_SECTION_NAMES = frozenset({'h1', 'h2', 'h3', 'h4', 'p', 'ul', 'ol'})
+
+# Table-of-contents and menu headings that do not start a real section
+_NAV_HEADINGS = frozenset({'contents', 'navigation', 'menu'})
+
+
+# Class attribute predicates, called with each class name of a candidate.
+# Plain substring tests instead of a regex search per candidate element.
+def _is_references_class(value: Optional[str]) -> bool:
+    return value is not None and ('references' in value or 'bibliography' in value)
+
+
+def _is_info_class(value: Optional[str]) -> bool:
+    return value is not None and ('info' in value or 'fact' in value or 'summary' in value)
+
+
+def _is_date_class(value: Optional[str]) -> bool:
+    return value is not None and ('date' in value or 'time' in value or 'modified' in value)
+
+
+def _id_is(value: str):
+    return lambda tag: tag.get('id') == value
+
+
+def _class_is(value: str):
+    return lambda tag: value in (tag.get('class') or ())
+
+
+def _class_matches(predicate):
+    return lambda tag: any(predicate(value) for value in tag.get('class') or ())
+
+
+def _any_tag(tag: Tag) -> bool:
+    return True
+
+
+# Page-level selectors, keyed by tag name. parse_page walks the document
+# once and records the first element matching each selector, replacing a
+# separate soup.find() (and a full-document walk on every miss) per
+# candidate in the title/content/infobox/category/date fallback chains.
+_PAGE_SELECTORS = {
+    'h1': (
+        ('h1#firstHeading', _id_is('firstHeading')),
+        ('h1.title', _class_is('title')),
+        ('h1.page-title', _class_is('page-title')),
+        ('h1', _any_tag),
+    ),
+    'title': (('title', _any_tag),),
+    'div': (
+        ('div#content', _id_is('content')),
+        ('div.content', _class_is('content')),
+        ('div#mw-content-text', _id_is('mw-content-text')),
+        ('div.infobox', _class_is('infobox')),
+        ('div#categories', _id_is('categories')),
+        ('div.categories', _class_is('categories')),
+        ('div#mw-normal-catlinks', _id_is('mw-normal-catlinks')),
+        ('div.date', _class_matches(_is_date_class)),
+    ),
+    'main': (('main', _any_tag),),
+    'article': (('article', _any_tag),),
+    'table': (
+        ('table.infobox', _class_is('infobox')),
+        ('table.info', _class_matches(_is_info_class)),
+    ),
+    'aside': (('aside.infobox', _class_is('infobox')),),
+    'footer': (('footer', _any_tag),),
+    'time': (('time', _any_tag),),
+    'span': (('span.date', _class_matches(_is_date_class)),),
+    'meta': (('meta[modified]', lambda tag: tag.get('property') == 'article:modified_time'),),
+    'li': (('li#footer-info-lastmod', _id_is('footer-info-lastmod')),),
+}
+
+# Headings that may introduce an external-links list, collected in the same walk
+_LINK_HEADER_NAMES = frozenset({'h2', 'h3', 'h4'})
+
+# Containers that can hold the list of links following such a heading
+_LINK_LIST_NAMES = frozenset({'ul', 'ol', 'div'})
+
+# Citation markers inside the content: <sup class="reference"> and
+# <a>/<span> with class "citation"
+_CITATION_CLASSES = {'sup': 'reference', 'a': 'citation', 'span': 'citation'}
+
+
+def _index_page(soup: BeautifulSoup):
+    """
+    Walk the document once, collecting the elements parse_page looks up.
+
+    Args:
+        soup: Parsed document
+
+    Returns:
+        Tuple of (first element per _PAGE_SELECTORS key, h2-h4 headings in
+        document order)
+    """
+    found = {}
+    link_headers = []
+
+    for tag in soup.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        name = tag.name
+        if name in _LINK_HEADER_NAMES:
+            link_headers.append(tag)
+            continue
+        selectors = _PAGE_SELECTORS.get(name)
+        if selectors:
+            for key, matches in selectors:
+                if key not in found and matches(tag):
+                    found[key] = tag
+
+    return found, link_headers
+
+
+def _index_content(content_div: Tag) -> Dict[str, list]:
+    """
+    Walk the content container once, bucketing what the content extractors read.
+
+    Args:
+        content_div: Main content element
+
+    Returns:
+        Dict with 'sections' (headings, paragraphs and lists in document
+        order), 'sup'/'a'/'span' (citation markers per pattern), 'refs'
+        (the first references/bibliography container, if any) and 'img'
+    """
+    index = {'sections': [], 'sup': [], 'a': [], 'span': [], 'refs': [], 'img': []}
+    sections = index['sections']
+    images = index['img']
+
+    for tag in content_div.descendants:
+        if not isinstance(tag, Tag):
+            continue
+        name = tag.name
+        if name in _SECTION_NAMES:
+            sections.append(tag)
+        elif name == 'img':
+            images.append(tag)
+        elif name in _CITATION_CLASSES:
+            if _CITATION_CLASSES[name] in (tag.get('class') or ()):
+                index[name].append(tag)
+        elif name in ('div', 'section') and not index['refs']:
+            if any(_is_references_class(value) for value in tag.get('class') or ()):
+                index['refs'].append(tag)
+
+    return index
+
+
 class GrokipediaScraper(BaseScraper):
     """
     Scraper for Grokipedia pages (grokipedia.com).
@@ -39,49 +204,51 @@ class GrokipediaScraper(BaseScraper):
         Returns:
             Structured PageContent
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, 'lxml')
+        found, link_headers = _index_page(soup)
 
         # Extract title (try common patterns)
-        title = self._extract_title(soup)
+        title = self._extract_title(found)
 
         # Extract main content
         # Try common content container IDs/classes
         content_div = (
-            soup.find('div', {'id': 'content'}) or
-            soup.find('div', {'class': 'content'}) or
-            soup.find('main') or
-            soup.find('article') or
-            soup.find('div', {'id': 'mw-content-text'})  # If using MediaWiki structure
+            found.get('div#content') or
+            found.get('div.content') or
+            found.get('main') or
+            found.get('article') or
+            found.get('div#mw-content-text')  # If using MediaWiki structure
         )
+        content = _index_content(content_div) if content_div else None
 
         # Extract sections
-        sections = self._extract_sections(content_div) if content_div else {}
+        sections = self._extract_sections(content['sections']) if content else {}
 
         # Extract text content
-        text_content = self.extract_text_from_html(str(content_div)) if content_div else ""
+        text_content = self.extract_text_from_tag(content_div) if content_div else ""
 
         # Extract citations
-        citations = self._extract_citations(content_div) if content_div else []
+        citations = self._extract_citations(content) if content else []
 
         # Extract infobox
-        infobox = self._extract_infobox(soup)
+        infobox = self._extract_infobox(found)
 
         # Extract images
-        images = self._extract_images(content_div) if content_div else []
+        images = self._extract_images(content['img']) if content else []
 
         # Extract categories
-        categories = self._extract_categories(soup)
+        categories = self._extract_categories(found)
 
         # Extract external links
-        external_links = self._extract_external_links(soup)
+        external_links = self._extract_external_links(link_headers)
 
         # Extract last modified date
-        last_modified = self._extract_last_modified(soup)
+        last_modified = self._extract_last_modified(found)
 
         return PageContent(
             title=title,
             url=url,
-            raw_html=html,
+            raw_html=html if self.keep_raw_html else None,
             text_content=text_content,
             sections=sections,
             citations=citations,
@@ -93,36 +260,36 @@ class GrokipediaScraper(BaseScraper):
             metadata={'source': 'grokipedia'}
         )
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, found: Dict[str, Tag]) -> str:
         """Extract page title from various possible locations"""
         # Try common title locations
         title_candidates = [
-            soup.find('h1', {'id': 'firstHeading'}),
-            soup.find('h1', {'class': 'title'}),
-            soup.find('h1', {'class': 'page-title'}),
-            soup.find('h1'),
-            soup.find('title')
+            found.get('h1#firstHeading'),
+            found.get('h1.title'),
+            found.get('h1.page-title'),
+            found.get('h1'),
+            found.get('title')
         ]
 
         for candidate in title_candidates:
             if candidate:
                 text = candidate.get_text().strip()
                 # Clean up title (remove " - Grokipedia" suffix if present)
-                text = re.sub(r'\s*[-–—]\s*Grokipedia.*$', '', text)
+                text = _GROKIPEDIA_SUFFIX_RE.sub('', text)
                 if text:
                     return text
 
         return "Unknown Title"
 
-    def _extract_sections(self, content_div) -> Dict[str, str]:
+    def _extract_sections(self, elements: List[Tag]) -> Dict[str, str]:
         """Extract sections with headers and their content"""
         sections = {}
         current_section = "Introduction"
         current_content = []
 
         # Look for various heading patterns
-        for elem in content_div.find_all(['h1', 'h2', 'h3', 'h4', 'p', 'ul', 'ol', 'div']):
-            if elem.name in ['h1', 'h2', 'h3', 'h4']:
+        for elem in elements:
+            if elem.name in _HEADING_NAMES:
                 # Save previous section
                 if current_content:
                     sections[current_section] = ' '.join(current_content)
@@ -132,10 +299,10 @@ class GrokipediaScraper(BaseScraper):
                 current_section = elem.get_text().strip()
 
                 # Skip empty or navigation headers
-                if not current_section or current_section.lower() in ['contents', 'navigation', 'menu']:
+                if not current_section or current_section.lower() in _NAV_HEADINGS:
                     current_section = "Introduction"
 
-            elif elem.name in ['p', 'ul', 'ol']:
+            else:
                 # Add content to current section
                 text = elem.get_text().strip()
                 if text and len(text) > 10:  # Ignore very short snippets
@@ -147,16 +314,13 @@ class GrokipediaScraper(BaseScraper):
 
         return sections
 
-    def _extract_citations(self, content_div) -> List[Dict]:
+    def _extract_citations(self, content: Dict[str, list]) -> List[Dict]:
         """Extract citations/references"""
         citations = []
 
-        # Try multiple patterns for citations
-        ref_patterns = [
-            content_div.find_all('sup', {'class': 'reference'}),
-            content_div.find_all('a', {'class': 'citation'}),
-            content_div.find_all('span', {'class': 'citation'})
-        ]
+        # Try multiple patterns for citations. Numbering runs through
+        # each pattern in turn.
+        ref_patterns = (content['sup'], content['a'], content['span'])
 
         citation_num = 1
         for pattern in ref_patterns:
@@ -170,8 +334,7 @@ class GrokipediaScraper(BaseScraper):
                 citation_num += 1
 
         # Also look for a references/bibliography section
-        refs_section = content_div.find(['div', 'section'], {'class': re.compile(r'references|bibliography')})
-        if refs_section:
+        for refs_section in content['refs']:
             ref_items = refs_section.find_all(['li', 'p'])
             for i, item in enumerate(ref_items, citation_num):
                 text = item.get_text().strip()
@@ -184,14 +347,14 @@ class GrokipediaScraper(BaseScraper):
 
         return citations
 
-    def _extract_infobox(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_infobox(self, found: Dict[str, Tag]) -> Optional[Dict]:
         """Extract infobox data"""
         # Try various infobox patterns
         infobox = (
-            soup.find('table', {'class': 'infobox'}) or
-            soup.find('div', {'class': 'infobox'}) or
-            soup.find('aside', {'class': 'infobox'}) or
-            soup.find('table', {'class': re.compile(r'info|fact|summary')})
+            found.get('table.infobox') or
+            found.get('div.infobox') or
+            found.get('aside.infobox') or
+            found.get('table.info')
         )
 
         if not infobox:
@@ -213,36 +376,37 @@ class GrokipediaScraper(BaseScraper):
 
         return data if data else None
 
-    def _extract_images(self, content_div) -> List[str]:
+    def _extract_images(self, img_tags: List[Tag]) -> List[str]:
         """Extract image URLs"""
         images = []
-        img_tags = content_div.find_all('img')
+        append = images.append
+        base_url = self.BASE_URL
 
         for img in img_tags:
             src = img.get('src', '') or img.get('data-src', '')
-            if src:
-                # Handle relative URLs
-                if src.startswith('//'):
-                    src = 'https:' + src
-                elif src.startswith('/'):
-                    src = self.BASE_URL + src
+            # Skip missing sources, tiny icons and SVGs before any URL work
+            if not src or src.endswith('.svg') or 'icon' in src.lower():
+                continue
 
-                # Skip tiny icons and SVGs
-                if not src.endswith('.svg') and 'icon' not in src.lower():
-                    images.append(src)
+            # Handle relative URLs
+            if src.startswith('//'):
+                src = 'https:' + src
+            elif src.startswith('/'):
+                src = base_url + src
+            append(src)
 
         return images
 
-    def _extract_categories(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_categories(self, found: Dict[str, Tag]) -> List[str]:
         """Extract page categories"""
         categories = []
 
         # Try various category patterns
         cat_containers = [
-            soup.find('div', {'id': 'categories'}),
-            soup.find('div', {'class': 'categories'}),
-            soup.find('div', {'id': 'mw-normal-catlinks'}),
-            soup.find('footer')
+            found.get('div#categories'),
+            found.get('div.categories'),
+            found.get('div#mw-normal-catlinks'),
+            found.get('footer')
         ]
 
         for container in cat_containers:
@@ -253,37 +417,46 @@ class GrokipediaScraper(BaseScraper):
                     if text and text.lower() not in ['category', 'categories']:
                         categories.append(text)
 
-        return list(set(categories))  # Remove duplicates
+        return list(dict.fromkeys(categories))  # Remove duplicates, keeping page order
 
-    def _extract_external_links(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_external_links(self, headers: List[Tag]) -> List[str]:
         """Extract external links"""
         links = []
+        append = links.append
+        base_url = self.BASE_URL
 
         # Look for external links section
-        ext_links_headers = soup.find_all(['h2', 'h3', 'h4'],
-                                          string=re.compile(r'External [Ll]inks?|References?|Sources?'))
+        for header in headers:
+            header_text = header.string
+            if header_text is None or not _EXT_LINKS_HEADER_RE.search(header_text):
+                continue
 
-        for header in ext_links_headers:
-            # Find the next list after the header
-            next_elem = header.find_next_sibling(['ul', 'ol', 'div'])
+            # Find the next list after the header, scanning the sibling
+            # chain directly rather than through bs4's name matching
+            next_elem = next(
+                (sibling for sibling in header.next_siblings
+                 if isinstance(sibling, Tag) and sibling.name in _LINK_LIST_NAMES),
+                None
+            )
             if next_elem:
                 for link in next_elem.find_all('a', href=True):
-                    href = link.get('href', '')
+                    href = link['href']
                     # Only include actual external links
-                    if href.startswith('http') and self.BASE_URL not in href:
-                        links.append(href)
+                    if not href.startswith('http') or base_url in href:
+                        continue
+                    append(href)
 
         return links
 
-    def _extract_last_modified(self, soup: BeautifulSoup) -> Optional[datetime]:
+    def _extract_last_modified(self, found: Dict[str, Tag]) -> Optional[datetime]:
         """Extract last modified date"""
         # Try various date patterns
         date_patterns = [
-            soup.find('time'),
-            soup.find('span', {'class': re.compile(r'date|time|modified')}),
-            soup.find('div', {'class': re.compile(r'date|time|modified')}),
-            soup.find('meta', {'property': 'article:modified_time'}),
-            soup.find('li', {'id': 'footer-info-lastmod'})
+            found.get('time'),
+            found.get('span.date'),
+            found.get('div.date'),
+            found.get('meta[modified]'),
+            found.get('li#footer-info-lastmod')
         ]
 
         for elem in date_patterns:
@@ -306,13 +479,22 @@ class GrokipediaScraper(BaseScraper):
 
             # Try to parse text content
             text = elem.get_text()
-            date_match = re.search(r'(\d{1,2}\s+\w+\s+\d{4})', text)
+            date_match = _DATE_RE.search(text)
             if date_match:
+                day, month_name, year = date_match.groups()
+                month = _MONTHS.get(month_name.lower())
+                if month:
+                    try:
+                        return datetime(int(year), month, int(day))
+                    except ValueError:
+                        continue  # Out-of-range day, e.g. "31 February 2024"
+
+                # Not an English month name: let strptime try the locale's names
                 try:
-                    return datetime.strptime(date_match.group(1), '%d %B %Y')
+                    return datetime.strptime(date_match.group(0), '%d %B %Y')
                 except ValueError:
                     try:
-                        return datetime.strptime(date_match.group(1), '%B %d, %Y')
+                        return datetime.strptime(date_match.group(0), '%B %d, %Y')
                     except ValueError:
                         pass
 
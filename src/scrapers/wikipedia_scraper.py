@@ -2,13 +2,58 @@
 Wikipedia scraper using the Wikipedia API and HTML parsing
 """
 
+import asyncio
+import logging
 import re
 from typing import Dict, List, Optional
 from datetime import datetime
 from urllib.parse import quote
-from bs4 import BeautifulSoup
+from lxml import etree
+from lxml import html as lxml_html
 
-from .base_scraper import BaseScraper, PageContent
+from .base_scraper import BaseScraper, PageContent, _blank_non_text
+
+logger = logging.getLogger(__name__)
+
+# Dates like "31 October 2024" in the footer's last-edited notice
+_DATE_RE = re.compile(r'(\d{1,2}\s+\w+\s+\d{4})')
+
+
+def _has_class(name: str) -> str:
+    """XPath predicate matching one entry of a whitespace-separated class list"""
+    return f'contains(concat(" ", normalize-space(@class), " "), " {name} ")'
+
+
+# Precompiled selectors for the fixed MediaWiki page layout. Each one is a
+# single C-level tree walk; absolute paths search the whole document and
+# relative ones are evaluated against the content div.
+_XP_TITLE = etree.XPath('//h1[@id="firstHeading"]')
+_XP_TITLE_TAG = etree.XPath('//title')
+_XP_CONTENT = etree.XPath('//div[@id="mw-content-text"]')
+_XP_PARSER_OUTPUT = etree.XPath(f'//div[{_has_class("mw-parser-output")}]')
+_XP_HEADLINE = etree.XPath(f'.//span[{_has_class("mw-headline")}]')
+_XP_INFOBOX = etree.XPath(f'//table[{_has_class("infobox")}]')
+_XP_CATEGORY_LINKS = etree.XPath('//div[@id="mw-normal-catlinks"]//a')
+_XP_EXTERNAL_LINKS = etree.XPath(
+    '//span[@id="External_links"]/ancestor::*[self::h2 or self::h3][1]'
+    f'/following-sibling::ul[1]//a[{_has_class("external")}]/@href'
+)
+_XP_LASTMOD = etree.XPath('//li[@id="footer-info-lastmod"]')
+
+# Content elements read by the section, citation and image extractors,
+# collected in one filtered walk of the content div
+_CONTENT_TAGS = ('h2', 'h3', 'p', 'ul', 'ol', 'img', 'sup')
+
+
+def _text(elem) -> str:
+    """Concatenated visible text of an element"""
+    return elem.text_content()
+
+
+def _first(xpath, node):
+    """First result of a precompiled XPath, or None"""
+    found = xpath(node)
+    return found[0] if found else None
 
 
 class WikipediaScraper(BaseScraper):
@@ -49,14 +94,64 @@ class WikipediaScraper(BaseScraper):
             data = response.json()
 
             if 'error' in data:
-                print(f"Wikipedia API error for '{topic}': {data['error']['info']}")
+                logger.warning("Wikipedia API error for '%s': %s", topic, data['error']['info'])
                 return None
 
             return data.get('parse', {})
         except Exception as e:
-            print(f"Failed to fetch Wikipedia API data for '{topic}': {e}")
+            logger.warning("Failed to fetch Wikipedia API data for '%s': %s", topic, e)
             return None
 
+    def fetch_structured(self, topic: str) -> Optional[PageContent]:
+        """
+        Fetch and parse a page through the MediaWiki parse API.
+
+        The API returns only the rendered article body, with no page chrome,
+        alongside structured metadata. Title and categories are taken from
+        the JSON directly. Section text, citations, infobox and images still
+        come from the body HTML, since the API lists section titles only.
+        The API response has no last-edited footer, so last_modified is None.
+
+        Args:
+            topic: Page title
+
+        Returns:
+            Parsed PageContent or None if failed
+        """
+        data = self._fetch_via_api(topic)
+        if not data:
+            return None
+
+        html = data.get('text', {}).get('*', '')
+        page = self.parse_page(html, self.get_page_url(topic))
+
+        page.title = data.get('title') or page.title
+        # Hidden maintenance categories aren't shown in the page's category box
+        page.categories = [
+            category['*'].replace('_', ' ')
+            for category in data.get('categories', [])
+            if 'hidden' not in category
+        ]
+        page.metadata['revid'] = data.get('revid')
+
+        return page
+
+    async def afetch_structured(self, topic: str) -> Optional[PageContent]:
+        """
+        Async variant of fetch_structured.
+
+        Runs in the default executor like afetch_and_parse, so API requests
+        for several topics can be gathered on one event loop.
+
+        Args:
+            topic: Page title
+
+        Returns:
+            Parsed PageContent or None if failed
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self.fetch_structured, topic)
+
     def parse_page(self, html: str, url: str) -> PageContent:
         """
         Parse Wikipedia HTML into structured PageContent.
@@ -68,44 +163,65 @@ class WikipediaScraper(BaseScraper):
         Returns:
             Structured PageContent
         """
-        soup = BeautifulSoup(html, 'html.parser')
+        try:
+            tree = lxml_html.document_fromstring(html)
+        except etree.ParserError:
+            # Empty or whitespace-only document
+            tree = lxml_html.document_fromstring('<html></html>')
 
-        # Extract title
-        title = self._extract_title(soup)
+        _blank_non_text(tree)
 
-        # Extract main content
-        content_div = soup.find('div', {'id': 'mw-content-text'})
-        if not content_div:
-            content_div = soup.find('div', {'class': 'mw-parser-output'})
+        # Extract title
+        title = self._extract_title(tree)
+
+        # Extract main content; API-rendered HTML is just the parser output div
+        content_div = _first(_XP_CONTENT, tree)
+        if content_div is None:
+            content_div = _first(_XP_PARSER_OUTPUT, tree)
+
+        # One walk of the content feeds sections, citations and images
+        section_elems = []
+        refs = []
+        img_tags = []
+        if content_div is not None:
+            for elem in content_div.iterdescendants(*_CONTENT_TAGS):
+                tag = elem.tag
+                if tag == 'img':
+                    img_tags.append(elem)
+                elif tag == 'sup':
+                    if 'reference' in (elem.get('class') or '').split():
+                        refs.append(elem)
+                else:
+                    section_elems.append(elem)
 
         # Extract sections
-        sections = self._extract_sections(content_div) if content_div else {}
+        sections = self._extract_sections(section_elems)
 
         # Extract text content
-        text_content = self.extract_text_from_html(str(content_div)) if content_div else ""
+        text_content = self._clean_whitespace(_text(content_div)) if content_div is not None else ""
 
         # Extract citations
-        citations = self._extract_citations(content_div) if content_div else []
+        citations = self._extract_citations(refs)
 
         # Extract infobox
-        infobox = self._extract_infobox(soup)
+        infobox = self._extract_infobox(tree)
 
         # Extract images
-        images = self._extract_images(content_div) if content_div else []
+        images = self._extract_images(img_tags)
 
         # Extract categories
-        categories = self._extract_categories(soup)
+        categories = self._extract_categories(tree)
 
         # Extract external links
-        external_links = self._extract_external_links(soup)
+        external_links = self._extract_external_links(tree)
 
         # Extract last modified date
-        last_modified = self._extract_last_modified(soup)
+        last_modified = self._extract_last_modified(tree)
 
         return PageContent(
             title=title,
             url=url,
-            raw_html=html,
+            raw_html=html if self.keep_raw_html else None,
             text_content=text_content,
             sections=sections,
             citations=citations,
@@ -117,37 +233,37 @@ class WikipediaScraper(BaseScraper):
             metadata={'source': 'wikipedia'}
         )
 
-    def _extract_title(self, soup: BeautifulSoup) -> str:
+    def _extract_title(self, tree) -> str:
         """Extract page title"""
-        title_elem = soup.find('h1', {'id': 'firstHeading'})
-        if title_elem:
-            return title_elem.get_text().strip()
+        title_elem = _first(_XP_TITLE, tree)
+        if title_elem is not None:
+            return _text(title_elem).strip()
         # Fallback to title tag
-        title_tag = soup.find('title')
-        if title_tag:
-            return title_tag.get_text().replace(' - Wikipedia', '').strip()
+        title_tag = _first(_XP_TITLE_TAG, tree)
+        if title_tag is not None:
+            return _text(title_tag).replace(' - Wikipedia', '').strip()
         return "Unknown Title"
 
-    def _extract_sections(self, content_div) -> Dict[str, str]:
+    def _extract_sections(self, elements: List) -> Dict[str, str]:
         """Extract sections with headers and their content"""
         sections = {}
         current_section = "Introduction"
         current_content = []
 
-        for elem in content_div.find_all(['h2', 'h3', 'p', 'ul', 'ol']):
-            if elem.name in ['h2', 'h3']:
+        for elem in elements:
+            if elem.tag in ('h2', 'h3'):
                 # Save previous section
                 if current_content:
                     sections[current_section] = ' '.join(current_content)
                     current_content = []
 
                 # Start new section
-                headline = elem.find('span', {'class': 'mw-headline'})
-                if headline:
-                    current_section = headline.get_text().strip()
+                headline = _first(_XP_HEADLINE, elem)
+                if headline is not None:
+                    current_section = _text(headline).strip()
             else:
                 # Add content to current section
-                text = elem.get_text().strip()
+                text = _text(elem).strip()
                 if text:
                     current_content.append(text)
 
@@ -157,46 +273,43 @@ class WikipediaScraper(BaseScraper):
 
         return sections
 
-    def _extract_citations(self, content_div) -> List[Dict]:
+    def _extract_citations(self, refs: List) -> List[Dict]:
         """Extract citations/references"""
         citations = []
-        refs = content_div.find_all('sup', {'class': 'reference'})
 
         for i, ref in enumerate(refs, 1):
-            link = ref.find('a')
-            if link:
+            link = next(ref.iterdescendants('a'), None)
+            if link is not None:
                 citations.append({
                     'number': i,
                     'id': link.get('href', '').replace('#', ''),
-                    'text': ref.get_text().strip()
+                    'text': _text(ref).strip()
                 })
 
         return citations
 
-    def _extract_infobox(self, soup: BeautifulSoup) -> Optional[Dict]:
+    def _extract_infobox(self, tree) -> Optional[Dict]:
         """Extract infobox data"""
-        infobox = soup.find('table', {'class': 'infobox'})
-        if not infobox:
+        infobox = _first(_XP_INFOBOX, tree)
+        if infobox is None:
             return None
 
         data = {}
-        rows = infobox.find_all('tr')
 
-        for row in rows:
-            header = row.find('th')
-            value = row.find('td')
+        for row in infobox.iterdescendants('tr'):
+            header = next(row.iterdescendants('th'), None)
+            value = next(row.iterdescendants('td'), None)
 
-            if header and value:
-                key = header.get_text().strip()
-                val = value.get_text().strip()
+            if header is not None and value is not None:
+                key = _text(header).strip()
+                val = _text(value).strip()
                 data[key] = val
 
         return data if data else None
 
-    def _extract_images(self, content_div) -> List[str]:
+    def _extract_images(self, img_tags: List) -> List[str]:
         """Extract image URLs"""
         images = []
-        img_tags = content_div.find_all('img')
 
         for img in img_tags:
             src = img.get('src', '')
@@ -207,44 +320,29 @@ class WikipediaScraper(BaseScraper):
 
         return images
 
-    def _extract_categories(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_categories(self, tree) -> List[str]:
         """Extract page categories"""
         categories = []
-        cat_div = soup.find('div', {'id': 'mw-normal-catlinks'})
 
-        if cat_div:
-            cat_links = cat_div.find_all('a')
-            for link in cat_links:
-                if link.get_text() != "Categories":
-                    categories.append(link.get_text().strip())
+        for link in _XP_CATEGORY_LINKS(tree):
+            text = _text(link)
+            if text != "Categories":
+                categories.append(text.strip())
 
         return categories
 
-    def _extract_external_links(self, soup: BeautifulSoup) -> List[str]:
+    def _extract_external_links(self, tree) -> List[str]:
         """Extract external links from the External Links section"""
-        links = []
-        ext_links_section = soup.find('span', {'id': 'External_links'})
-
-        if ext_links_section:
-            parent = ext_links_section.find_parent(['h2', 'h3'])
-            if parent:
-                # Find the next ul after the header
-                ul = parent.find_next_sibling('ul')
-                if ul:
-                    for link in ul.find_all('a', {'class': 'external'}):
-                        href = link.get('href', '')
-                        if href:
-                            links.append(href)
-
-        return links
-
-    def _extract_last_modified(self, soup: BeautifulSoup) -> Optional[datetime]:
+        # Header span -> enclosing h2/h3 -> next ul -> a.external hrefs
+        return [str(href) for href in _XP_EXTERNAL_LINKS(tree) if href]
+
+    def _extract_last_modified(self, tree) -> Optional[datetime]:
         """Extract last modified date"""
-        footer = soup.find('li', {'id': 'footer-info-lastmod'})
-        if footer:
-            text = footer.get_text()
+        footer = _first(_XP_LASTMOD, tree)
+        if footer is not None:
+            text = _text(footer)
             # Parse date string like "This page was last edited on 31 October 2024, at 10:00"
-            match = re.search(r'(\d{1,2}\s+\w+\s+\d{4})', text)
+            match = _DATE_RE.search(text)
             if match:
                 try:
                     return datetime.strptime(match.group(1), '%d %B %Y')
@@ -2,15 +2,87 @@
 Report generator for creating comparison reports
 """
 
+import heapq
 import json
-from typing import List, Dict
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict, dataclass, field
+from io import StringIO
+from typing import Callable, List, Dict, Optional
 from pathlib import Path
 from datetime import datetime
-from collections import Counter
 
 from ..comparators.page_comparator import ComparisonResult
 from ..analyzers.metrics_analyzer import MetricsAnalyzer, QualityMetrics, BiasMetrics
 
+# Report files are written through a 128 KB buffer (vs. the 8 KB default)
+# so large reports go out in a handful of write calls
+_WRITE_BUFFER_SIZE = 1 << 17
+
+# Same settings as json.dumps(obj, indent=2), built once for per-record export
+_JSON_ENCODER = json.JSONEncoder(indent=2)
+
+# Report rules and the fixed summary title/footer blocks. The footer has no
+# trailing newline: reports end on the closing rule.
+_RULE = "=" * 80
+_RULE_LINE = _RULE + "\n"
+_THIN_RULE_LINE = "-" * 75 + "\n"
+_SUMMARY_TITLE = _RULE_LINE + "GROKIPEDIA VS WIKIPEDIA COMPARISON REPORT\n" + _RULE_LINE
+_SUMMARY_FOOTER = _RULE_LINE + "END OF REPORT\n" + _RULE
+
+# Characters replaced with "_" in report file names: everything that is not
+# alphanumeric (exactly the complement of str.isalnum(), Unicode included)
+_UNSAFE_FILENAME_CHAR_RE = re.compile(r'[\W_]')
+
+# Widest histogram bar in the summary report, in characters
+_MAX_BAR_WIDTH = 60
+
+# Length of the most/least similar page lists in the summary report
+_TOP_N = 10
+
+
+def page_metrics_to_dict(result: ComparisonResult) -> Dict:
+    """
+    JSON-ready quality and bias metrics for both pages of a result.
+
+    The metrics are only present once the orchestrator's analyze_results
+    has stored them in page metadata; unanalyzed results give an empty dict.
+
+    Args:
+        result: ComparisonResult object
+
+    Returns:
+        Dict with quality_metrics_/bias_metrics_ keys per source
+    """
+    record = {}
+    for source, page in (('grokipedia', result.grokipedia_page), ('wikipedia', result.wikipedia_page)):
+        metadata = page.metadata
+        if 'quality_metrics' in metadata:
+            record[f'quality_metrics_{source}'] = asdict(metadata['quality_metrics'])
+        if 'bias_metrics' in metadata:
+            record[f'bias_metrics_{source}'] = asdict(metadata['bias_metrics'])
+    return record
+
+
+@dataclass
+class _SummaryStats:
+    """Aggregates behind the summary report, gathered in one pass over the results"""
+    total_similarity: float = 0.0
+    total_abs_word_diff: int = 0
+    high_similarity: int = 0
+    medium_similarity: int = 0
+    low_similarity: int = 0
+    buckets: List[int] = field(default_factory=lambda: [0] * 10)
+    longer_on_grok: int = 0
+    longer_on_wiki: int = 0
+    more_citations_grok: int = 0
+    more_citations_wiki: int = 0
+    most_similar: List[ComparisonResult] = field(default_factory=list)
+    most_different: List[ComparisonResult] = field(default_factory=list)
+    biggest_word_diff: Optional[ComparisonResult] = None
+    most_unique_grokipedia: Optional[ComparisonResult] = None
+    most_unique_wikipedia: Optional[ComparisonResult] = None
+
 
 class ReportGenerator:
     """
@@ -42,71 +114,69 @@ class ReportGenerator:
         if not results:
             return "No comparison results to report."
 
-        timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-        report_lines = []
+        # One clock read, so the header and the file name agree
+        now = datetime.now()
+        timestamp = now.strftime("%Y-%m-%d %H:%M:%S")
+        buf = StringIO()
+        w = buf.write
 
         # Header
-        report_lines.append("=" * 80)
-        report_lines.append("GROKIPEDIA VS WIKIPEDIA COMPARISON REPORT")
-        report_lines.append("=" * 80)
-        report_lines.append(f"Generated: {timestamp}")
-        report_lines.append(f"Total Pages Analyzed: {len(results)}")
-        report_lines.append("=" * 80)
-        report_lines.append("")
+        w(_SUMMARY_TITLE)
+        w(f"Generated: {timestamp}\n")
+        w(f"Total Pages Analyzed: {len(results)}\n")
+        w(_RULE_LINE)
+        w("\n")
+
+        stats = self._collect_stats(results)
 
         # Overall statistics
-        report_lines.append("## OVERALL STATISTICS")
-        report_lines.append("")
-        report_lines.extend(self._generate_overall_stats(results))
-        report_lines.append("")
+        w("## OVERALL STATISTICS\n")
+        w("\n")
+        self._generate_overall_stats(stats, len(results), w)
+        w("\n")
 
         # Similarity distribution
-        report_lines.append("## SIMILARITY DISTRIBUTION")
-        report_lines.append("")
-        report_lines.extend(self._generate_similarity_distribution(results))
-        report_lines.append("")
+        w("## SIMILARITY DISTRIBUTION\n")
+        w("\n")
+        self._generate_similarity_distribution(stats, w)
+        w("\n")
 
         # Content analysis
-        report_lines.append("## CONTENT ANALYSIS")
-        report_lines.append("")
-        report_lines.extend(self._generate_content_analysis(results))
-        report_lines.append("")
+        w("## CONTENT ANALYSIS\n")
+        w("\n")
+        self._generate_content_analysis(stats, w)
+        w("\n")
 
         # Notable differences
-        report_lines.append("## NOTABLE DIFFERENCES")
-        report_lines.append("")
-        report_lines.extend(self._generate_notable_differences(results))
-        report_lines.append("")
+        w("## NOTABLE DIFFERENCES\n")
+        w("\n")
+        self._generate_notable_differences(stats, w)
+        w("\n")
 
         # Category breakdown
-        report_lines.append("## TOP 10 MOST SIMILAR PAGES")
-        report_lines.append("")
-        top_similar = sorted(results, key=lambda r: r.text_similarity, reverse=True)[:10]
-        for i, result in enumerate(top_similar, 1):
-            report_lines.append(f"{i}. {result.topic}: {result.text_similarity:.2%} similarity")
-        report_lines.append("")
-
-        report_lines.append("## TOP 10 MOST DIFFERENT PAGES")
-        report_lines.append("")
-        top_different = sorted(results, key=lambda r: r.text_similarity)[:10]
-        for i, result in enumerate(top_different, 1):
-            report_lines.append(f"{i}. {result.topic}: {result.text_similarity:.2%} similarity")
-        report_lines.append("")
-
-        # Footer
-        report_lines.append("=" * 80)
-        report_lines.append("END OF REPORT")
-        report_lines.append("=" * 80)
-
-        report_content = "\n".join(report_lines)
+        w("## TOP 10 MOST SIMILAR PAGES\n")
+        w("\n")
+        for i, result in enumerate(stats.most_similar, 1):
+            w(f"{i}. {result.topic}: {result.text_similarity:.2%} similarity\n")
+        w("\n")
+
+        w("## TOP 10 MOST DIFFERENT PAGES\n")
+        w("\n")
+        for i, result in enumerate(stats.most_different, 1):
+            w(f"{i}. {result.topic}: {result.text_similarity:.2%} similarity\n")
+        w("\n")
+
+        w(_SUMMARY_FOOTER)
+
+        report_content = buf.getvalue()
 
         # Save to file if specified
         if output_file:
             output_path = self.output_dir / output_file
         else:
-            output_path = self.output_dir / f"summary_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            output_path = self.output_dir / f"summary_report_{now.strftime('%Y%m%d_%H%M%S')}.txt"
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write(report_content)
 
         print(f"Report saved to: {output_path}")
@@ -123,98 +193,132 @@ class ReportGenerator:
         Returns:
             Report content as string
         """
-        report_lines = []
+        now = datetime.now()
+        buf = StringIO()
+        w = buf.write
 
         # Header
-        report_lines.append("=" * 80)
-        report_lines.append(f"DETAILED COMPARISON: {result.topic}")
-        report_lines.append("=" * 80)
-        report_lines.append(f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-        report_lines.append("")
+        w(_RULE_LINE)
+        w(f"DETAILED COMPARISON: {result.topic}\n")
+        w(_RULE_LINE)
+        w(f"Generated: {now.strftime('%Y-%m-%d %H:%M:%S')}\n")
+        w("\n")
 
         # Overview
-        report_lines.append("## OVERVIEW")
-        report_lines.append(f"Text Similarity: {result.text_similarity:.2%} ({result.similarity_category})")
-        report_lines.append(f"Levenshtein Distance: {result.levenshtein_distance}")
-        report_lines.append("")
+        w("## OVERVIEW\n")
+        w(f"Text Similarity: {result.text_similarity:.2%} ({result.similarity_category})\n")
+        w(f"Levenshtein Distance: {result.levenshtein_distance}\n")
+        w("\n")
 
         # Content metrics
-        report_lines.append("## CONTENT METRICS")
-        report_lines.append("")
-        report_lines.append(f"{'Metric':<30} {'Grokipedia':<15} {'Wikipedia':<15} {'Difference':<15}")
-        report_lines.append("-" * 75)
-        report_lines.append(
+        w("## CONTENT METRICS\n")
+        w("\n")
+        external_grok = result.external_links_grokipedia
+        external_wiki = result.external_links_wikipedia
+        # The whole table is one f-string: a single string build and write
+        w(
+            f"{'Metric':<30} {'Grokipedia':<15} {'Wikipedia':<15} {'Difference':<15}\n"
+            f"{_THIN_RULE_LINE}"
             f"{'Word Count':<30} {result.grokipedia_page.word_count:<15} "
-            f"{result.wikipedia_page.word_count:<15} {result.word_count_diff:<15}"
-        )
-        report_lines.append(
+            f"{result.wikipedia_page.word_count:<15} {result.word_count_diff:<15}\n"
             f"{'Citations':<30} {result.citation_count_grokipedia:<15} "
-            f"{result.citation_count_wikipedia:<15} {result.citation_diff:<15}"
-        )
-        report_lines.append(
-            f"{'External Links':<30} {result.external_links_grokipedia:<15} "
-            f"{result.external_links_wikipedia:<15} "
-            f"{result.external_links_grokipedia - result.external_links_wikipedia:<15}"
+            f"{result.citation_count_wikipedia:<15} {result.citation_diff:<15}\n"
+            f"{'External Links':<30} {external_grok:<15} "
+            f"{external_wiki:<15} {external_grok - external_wiki:<15}\n"
+            f"{'Has Infobox':<30} {result.has_infobox_grokipedia!s:<15} "
+            f"{result.has_infobox_wikipedia!s:<15} {'':<15}\n"
+            "\n"
         )
-        report_lines.append(
-            f"{'Has Infobox':<30} {str(result.has_infobox_grokipedia):<15} "
-            f"{str(result.has_infobox_wikipedia):<15} {'':<15}"
-        )
-        report_lines.append("")
 
         # Section analysis
-        report_lines.append("## SECTION ANALYSIS")
-        report_lines.append(f"Section Overlap: {result.section_overlap:.2%}")
-        report_lines.append("")
-
-        if result.unique_to_grokipedia:
-            report_lines.append("Sections unique to Grokipedia:")
-            for section in result.unique_to_grokipedia:
-                report_lines.append(f"  - {section}")
-            report_lines.append("")
-
-        if result.unique_to_wikipedia:
-            report_lines.append("Sections unique to Wikipedia:")
-            for section in result.unique_to_wikipedia:
-                report_lines.append(f"  - {section}")
-            report_lines.append("")
+        w("## SECTION ANALYSIS\n")
+        w(f"Section Overlap: {result.section_overlap:.2%}\n")
+        w("\n")
+
+        unique_to_grokipedia = result.unique_to_grokipedia
+        if unique_to_grokipedia:
+            w("Sections unique to Grokipedia:\n")
+            for section in unique_to_grokipedia:
+                w(f"  - {section}\n")
+            w("\n")
+
+        unique_to_wikipedia = result.unique_to_wikipedia
+        if unique_to_wikipedia:
+            w("Sections unique to Wikipedia:\n")
+            for section in unique_to_wikipedia:
+                w(f"  - {section}\n")
+            w("\n")
 
         # Key differences
-        report_lines.append("## KEY DIFFERENCES")
-        report_lines.append("")
+        w("## KEY DIFFERENCES\n")
+        w("\n")
         for i, diff in enumerate(result.key_differences, 1):
-            report_lines.append(f"{i}. {diff}")
-        report_lines.append("")
+            w(f"{i}. {diff}\n")
+        w("\n")
 
         # Diff segments (show first 10)
-        report_lines.append("## TEXT DIFFERENCES (Sample)")
-        report_lines.append("")
+        w("## TEXT DIFFERENCES (Sample)\n")
+        w("\n")
         for i, segment in enumerate(result.diff_segments[:10], 1):
-            if segment.type != 'equal':
-                report_lines.append(f"Diff #{i} ({segment.type}):")
-                if segment.grokipedia_text:
-                    report_lines.append(f"  Grokipedia: {segment.grokipedia_text[:200]}...")
-                if segment.wikipedia_text:
-                    report_lines.append(f"  Wikipedia: {segment.wikipedia_text[:200]}...")
-                report_lines.append("")
+            segment_type = segment.type
+            if segment_type != 'equal':
+                w(f"Diff #{i} ({segment_type}):\n")
+                grokipedia_text = segment.grokipedia_text
+                if grokipedia_text:
+                    w(f"  Grokipedia: {grokipedia_text[:200]}...\n")
+                wikipedia_text = segment.wikipedia_text
+                if wikipedia_text:
+                    w(f"  Wikipedia: {wikipedia_text[:200]}...\n")
+                w("\n")
 
-        report_lines.append("=" * 80)
+        w(_RULE)
 
-        report_content = "\n".join(report_lines)
+        report_content = buf.getvalue()
 
         # Save to file if specified
         if output_file:
             output_path = self.output_dir / output_file
         else:
-            safe_topic = "".join(c if c.isalnum() else "_" for c in result.topic)[:50]
-            output_path = self.output_dir / f"detailed_{safe_topic}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.txt"
+            output_path = self.output_dir / self._detailed_report_name(result.topic, now)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
+        with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
             f.write(report_content)
 
         print(f"Detailed report saved to: {output_path}")
         return report_content
 
+    def generate_detailed_reports(self, results: List[ComparisonResult], max_workers: int = 8) -> List[str]:
+        """
+        Generate a detailed report for each of several comparisons using a pool of threads.
+
+        Each report is written to its own default-named file, suffixed with
+        the result's index: topics like "C++" and "C#" map to the same name,
+        and reports written in the same second would otherwise overwrite
+        each other. Formatting holds the GIL, so the pool mainly overlaps the
+        file writes.
+
+        Args:
+            results: List of ComparisonResult objects
+            max_workers: Number of worker threads
+
+        Returns:
+            Report content for each result, in order
+        """
+        now = datetime.now()
+        output_files = [
+            self._detailed_report_name(result.topic, now, index)
+            for index, result in enumerate(results)
+        ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.generate_detailed_report, results, output_files))
+
+    @staticmethod
+    def _detailed_report_name(topic: str, now: datetime, index: Optional[int] = None) -> str:
+        """Default detailed report file name, optionally made unique by a batch index"""
+        safe_topic = _UNSAFE_FILENAME_CHAR_RE.sub("_", topic[:50])
+        suffix = f"_{index}" if index is not None else ""
+        return f"detailed_{safe_topic}_{now.strftime('%Y%m%d_%H%M%S')}{suffix}.txt"
+
     def export_json(self, results: List[ComparisonResult], output_file: str = None) -> str:
         """
         Export comparison results to JSON format.
@@ -226,107 +330,196 @@ class ReportGenerator:
         Returns:
             Path to exported file
         """
-        data = []
-
-        for result in results:
-            data.append({
-                'topic': result.topic,
-                'text_similarity': result.text_similarity,
-                'similarity_category': result.similarity_category,
-                'word_count_grokipedia': result.grokipedia_page.word_count,
-                'word_count_wikipedia': result.wikipedia_page.word_count,
-                'word_count_diff': result.word_count_diff,
-                'word_count_diff_pct': result.word_count_diff_pct,
-                'citation_count_grokipedia': result.citation_count_grokipedia,
-                'citation_count_wikipedia': result.citation_count_wikipedia,
-                'section_overlap': result.section_overlap,
-                'unique_to_grokipedia': result.unique_to_grokipedia,
-                'unique_to_wikipedia': result.unique_to_wikipedia,
-                'key_differences': result.key_differences,
-                'timestamp': result.timestamp.isoformat()
-            })
-
         if output_file:
             output_path = self.output_dir / output_file
         else:
             output_path = self.output_dir / f"comparison_results_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2)
+        # Records are encoded and written one at a time, so memory stays at one
+        # record rather than the whole document. Output is identical to
+        # json.dump(records, f, indent=2): each record is indented one level,
+        # which is safe as a plain replace since encoded JSON has no raw newlines.
+        with open(output_path, 'w', encoding='utf-8', buffering=_WRITE_BUFFER_SIZE) as f:
+            if not results:
+                f.write("[]")
+            else:
+                encode = _JSON_ENCODER.encode
+                separator = "[\n  "
+                for result in results:
+                    f.write(separator)
+                    f.write(encode(self._result_to_dict(result)).replace("\n", "\n  "))
+                    separator = ",\n  "
+                f.write("\n]")
 
         print(f"JSON export saved to: {output_path}")
         return str(output_path)
 
-    def _generate_overall_stats(self, results: List[ComparisonResult]) -> List[str]:
-        """Generate overall statistics"""
-        lines = []
-
-        avg_similarity = sum(r.text_similarity for r in results) / len(results)
-        lines.append(f"Average Similarity: {avg_similarity:.2%}")
-
-        similarity_categories = Counter(r.similarity_category for r in results)
-        lines.append(f"High Similarity: {similarity_categories.get('high', 0)} pages")
-        lines.append(f"Medium Similarity: {similarity_categories.get('medium', 0)} pages")
-        lines.append(f"Low Similarity: {similarity_categories.get('low', 0)} pages")
-
-        avg_word_diff = sum(abs(r.word_count_diff) for r in results) / len(results)
-        lines.append(f"Average Word Count Difference: {avg_word_diff:.0f} words")
-
-        return lines
+    @staticmethod
+    def _result_to_dict(result: ComparisonResult) -> Dict:
+        """JSON-ready record for one comparison result"""
+        return {
+            'topic': result.topic,
+            'text_similarity': result.text_similarity,
+            'similarity_category': result.similarity_category,
+            'word_count_grokipedia': result.grokipedia_page.word_count,
+            'word_count_wikipedia': result.wikipedia_page.word_count,
+            'word_count_diff': result.word_count_diff,
+            'word_count_diff_pct': result.word_count_diff_pct,
+            'citation_count_grokipedia': result.citation_count_grokipedia,
+            'citation_count_wikipedia': result.citation_count_wikipedia,
+            'section_overlap': result.section_overlap,
+            'unique_to_grokipedia': result.unique_to_grokipedia,
+            'unique_to_wikipedia': result.unique_to_wikipedia,
+            'key_differences': result.key_differences,
+            'timestamp': result.timestamp.isoformat(),
+            **page_metrics_to_dict(result)
+        }
+
+    @staticmethod
+    def _collect_stats(results: List[ComparisonResult]) -> _SummaryStats:
+        """
+        Gather every aggregate the summary report needs in a single pass.
 
-    def _generate_similarity_distribution(self, results: List[ComparisonResult]) -> List[str]:
-        """Generate similarity distribution"""
-        lines = []
+        The most/least similar pages are kept in bounded heaps rather than
+        by sorting all results. Heap entries carry the result's position, so
+        pages with equal similarity are listed in input order, as a stable
+        sort would list them. Running maxima replace max() scans and, like
+        max(), keep the first result on ties.
 
-        # Create histogram buckets
-        buckets = [0] * 10
-        for result in results:
-            bucket = min(int(result.text_similarity * 10), 9)
-            buckets[bucket] += 1
+        Args:
+            results: List of ComparisonResult objects
 
-        lines.append("Similarity Distribution (0.0 to 1.0):")
+        Returns:
+            _SummaryStats for the results
+        """
+        stats = _SummaryStats()
+        buckets = stats.buckets
+        total_similarity = 0.0
+        total_abs_word_diff = 0
+        high = medium = low = 0
+        longer_on_grok = longer_on_wiki = 0
+        more_citations_grok = more_citations_wiki = 0
+        top = []  # min-heap of (similarity, -position, result)
+        bottom = []  # min-heap of (-similarity, -position, result)
+
+        # Running maxima start from the first result, as max() does
+        biggest_diff = unique_grok = unique_wiki = results[0] if results else None
+        if biggest_diff is not None:
+            biggest_diff_pct = abs(biggest_diff.word_count_diff_pct)
+            unique_grok_count = len(biggest_diff.unique_to_grokipedia)
+            unique_wiki_count = len(biggest_diff.unique_to_wikipedia)
+
+        for i, result in enumerate(results):
+            similarity = result.text_similarity
+            total_similarity += similarity
+            bucket = int(similarity * 10)
+            buckets[bucket if bucket < 10 else 9] += 1  # 1.0 falls in the top bucket
+
+            category = result.similarity_category
+            if category == 'high':
+                high += 1
+            elif category == 'medium':
+                medium += 1
+            elif category == 'low':
+                low += 1
+
+            # Comparisons are added as 0/1 rather than branched on
+            word_diff = result.word_count_diff
+            total_abs_word_diff += abs(word_diff)
+            longer_on_grok += word_diff > 0
+            longer_on_wiki += word_diff < 0
+
+            citation_diff = result.citation_diff
+            more_citations_grok += citation_diff > 0
+            more_citations_wiki += citation_diff < 0
+
+            diff_pct = abs(result.word_count_diff_pct)
+            if diff_pct > biggest_diff_pct:
+                biggest_diff, biggest_diff_pct = result, diff_pct
+            unique_count = len(result.unique_to_grokipedia)
+            if unique_count > unique_grok_count:
+                unique_grok, unique_grok_count = result, unique_count
+            unique_count = len(result.unique_to_wikipedia)
+            if unique_count > unique_wiki_count:
+                unique_wiki, unique_wiki_count = result, unique_count
+
+            # A later page only displaces an earlier one on strictly better similarity
+            if len(top) < _TOP_N:
+                heapq.heappush(top, (similarity, -i, result))
+                heapq.heappush(bottom, (-similarity, -i, result))
+                continue
+            if similarity > top[0][0]:
+                heapq.heapreplace(top, (similarity, -i, result))
+            if similarity < -bottom[0][0]:
+                heapq.heapreplace(bottom, (-similarity, -i, result))
+
+        stats.total_similarity = total_similarity
+        stats.total_abs_word_diff = total_abs_word_diff
+        stats.high_similarity = high
+        stats.medium_similarity = medium
+        stats.low_similarity = low
+        stats.longer_on_grok = longer_on_grok
+        stats.longer_on_wiki = longer_on_wiki
+        stats.more_citations_grok = more_citations_grok
+        stats.more_citations_wiki = more_citations_wiki
+        stats.most_similar = [entry[2] for entry in sorted(top, reverse=True)]
+        stats.most_different = [entry[2] for entry in sorted(bottom, reverse=True)]
+        stats.biggest_word_diff = biggest_diff
+        stats.most_unique_grokipedia = unique_grok
+        stats.most_unique_wikipedia = unique_wiki
+        return stats
+
+    def _generate_overall_stats(self, stats: _SummaryStats, count: int, write: Callable[[str], int]):
+        """Write overall statistics"""
+        avg_similarity = stats.total_similarity / count
+        write(f"Average Similarity: {avg_similarity:.2%}\n")
+
+        write(f"High Similarity: {stats.high_similarity} pages\n")
+        write(f"Medium Similarity: {stats.medium_similarity} pages\n")
+        write(f"Low Similarity: {stats.low_similarity} pages\n")
+
+        avg_word_diff = stats.total_abs_word_diff / count
+        write(f"Average Word Count Difference: {avg_word_diff:.0f} words\n")
+
+    def _generate_similarity_distribution(self, stats: _SummaryStats, write: Callable[[str], int]):
+        """Write similarity distribution"""
+        buckets = stats.buckets
+        # One block per page, scaled down when the busiest bucket would run
+        # past _MAX_BAR_WIDTH. A non-empty bucket keeps at least one block so
+        # it never looks empty.
+        max_count = max(buckets)
+        scale = max_count > _MAX_BAR_WIDTH
+
+        write("Similarity Distribution (0.0 to 1.0):\n")
         for i, count in enumerate(buckets):
-            bar = "█" * count
-            lines.append(f"  {i/10:.1f}-{(i+1)/10:.1f}: {bar} ({count})")
-
-        return lines
-
-    def _generate_content_analysis(self, results: List[ComparisonResult]) -> List[str]:
-        """Generate content analysis"""
-        lines = []
-
-        longer_on_grok = sum(1 for r in results if r.word_count_diff > 0)
-        longer_on_wiki = sum(1 for r in results if r.word_count_diff < 0)
-
-        lines.append(f"Pages longer on Grokipedia: {longer_on_grok}")
-        lines.append(f"Pages longer on Wikipedia: {longer_on_wiki}")
-
-        more_citations_grok = sum(1 for r in results if r.citation_diff > 0)
-        more_citations_wiki = sum(1 for r in results if r.citation_diff < 0)
-
-        lines.append(f"Pages with more citations on Grokipedia: {more_citations_grok}")
-        lines.append(f"Pages with more citations on Wikipedia: {more_citations_wiki}")
-
-        return lines
-
-    def _generate_notable_differences(self, results: List[ComparisonResult]) -> List[str]:
-        """Generate notable differences"""
-        lines = []
-
-        # Find pages with biggest word count differences
-        biggest_diff = max(results, key=lambda r: abs(r.word_count_diff_pct))
-        lines.append(f"Biggest word count difference: {biggest_diff.topic}")
-        lines.append(f"  {abs(biggest_diff.word_count_diff_pct):.1f}% difference")
-
-        # Find pages with most unique sections
-        most_unique_grok = max(results, key=lambda r: len(r.unique_to_grokipedia))
+            width = count
+            if scale and count:
+                width = max(1, count * _MAX_BAR_WIDTH // max_count)
+            bar = "█" * width
+            write(f"  {i/10:.1f}-{(i+1)/10:.1f}: {bar} ({count})\n")
+
+    def _generate_content_analysis(self, stats: _SummaryStats, write: Callable[[str], int]):
+        """Write content analysis"""
+        write(f"Pages longer on Grokipedia: {stats.longer_on_grok}\n")
+        write(f"Pages longer on Wikipedia: {stats.longer_on_wiki}\n")
+
+        write(f"Pages with more citations on Grokipedia: {stats.more_citations_grok}\n")
+        write(f"Pages with more citations on Wikipedia: {stats.more_citations_wiki}\n")
+
+    def _generate_notable_differences(self, stats: _SummaryStats, write: Callable[[str], int]):
+        """Write notable differences"""
+        # Page with the biggest word count difference
+        biggest_diff = stats.biggest_word_diff
+        write(f"Biggest word count difference: {biggest_diff.topic}\n")
+        write(f"  {abs(biggest_diff.word_count_diff_pct):.1f}% difference\n")
+
+        # Pages with the most unique sections
+        most_unique_grok = stats.most_unique_grokipedia
         if most_unique_grok.unique_to_grokipedia:
-            lines.append(f"Most unique sections on Grokipedia: {most_unique_grok.topic}")
-            lines.append(f"  {len(most_unique_grok.unique_to_grokipedia)} unique sections")
+            write(f"Most unique sections on Grokipedia: {most_unique_grok.topic}\n")
+            write(f"  {len(most_unique_grok.unique_to_grokipedia)} unique sections\n")
 
-        most_unique_wiki = max(results, key=lambda r: len(r.unique_to_wikipedia))
+        most_unique_wiki = stats.most_unique_wikipedia
         if most_unique_wiki.unique_to_wikipedia:
-            lines.append(f"Most unique sections on Wikipedia: {most_unique_wiki.topic}")
-            lines.append(f"  {len(most_unique_wiki.unique_to_wikipedia)} unique sections")
-
-        return lines
+            write(f"Most unique sections on Wikipedia: {most_unique_wiki.topic}\n")
+            write(f"  {len(most_unique_wiki.unique_to_wikipedia)} unique sections\n")
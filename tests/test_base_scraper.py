@@ -0,0 +1,154 @@
+"""
+Unit tests for BaseScraper
+"""
+
+import json
+import time
+
+import requests
+
+from src.scrapers.base_scraper import BaseScraper, PageContent
+from src.scrapers.wikipedia_scraper import WikipediaScraper
+
+
+URL = 'https://en.wikipedia.org/wiki/Test'
+
+
+class FakeResponse:
+    """Minimal stand-in for requests.Response"""
+
+    def __init__(self, status_code=200, text='', headers=None):
+        self.status_code = status_code
+        self.text = text
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.HTTPError(f"{self.status_code} Error")
+
+
+def make_cached_scraper(tmp_path, monkeypatch, response=None):
+    """Scraper with a cache in tmp_path whose session.get records its calls"""
+    scraper = WikipediaScraper(rate_limit_delay=0, cache_dir=str(tmp_path))
+    calls = []
+
+    def fake_get(url, timeout=None, headers=None):
+        calls.append(headers)
+        return response or FakeResponse(text='<html>network</html>')
+
+    monkeypatch.setattr(scraper.session, 'get', fake_get)
+    return scraper, calls
+
+
+def test_fetch_page_writes_cache(tmp_path, monkeypatch):
+    """Test that a fetched page is stored with its validators"""
+    response = FakeResponse(text='<html>network</html>',
+                            headers={'ETag': '"v1"', 'Last-Modified': 'Wed, 01 Oct 2025 10:00:00 GMT'})
+    scraper, calls = make_cached_scraper(tmp_path, monkeypatch, response)
+
+    assert scraper._fetch_page(URL) == '<html>network</html>'
+
+    entry = scraper._read_cache(URL)
+    assert entry['body'] == '<html>network</html>'
+    assert entry['etag'] == '"v1"'
+    assert entry['last_modified'] == 'Wed, 01 Oct 2025 10:00:00 GMT'
+    assert calls == [{}]
+
+
+def test_fetch_page_fresh_cache_skips_network(tmp_path, monkeypatch):
+    """Test that an entry younger than cache_ttl is served without a request"""
+    scraper, calls = make_cached_scraper(tmp_path, monkeypatch)
+    scraper._write_cache(URL, '<html>cached</html>', '"v1"', None)
+
+    assert scraper._fetch_page(URL) == '<html>cached</html>'
+    assert calls == []
+
+
+def test_fetch_page_expired_cache_revalidates(tmp_path, monkeypatch):
+    """Test that an expired entry sends its validators and a 304 reuses the body"""
+    scraper, calls = make_cached_scraper(tmp_path, monkeypatch, FakeResponse(status_code=304))
+    scraper._write_cache(URL, '<html>cached</html>', '"v1"', 'Wed, 01 Oct 2025 10:00:00 GMT')
+
+    path = scraper._cache_path(URL)
+    entry = json.loads(path.read_text(encoding='utf-8'))
+    entry['fetched_at'] = time.time() - scraper.cache_ttl - 60
+    path.write_text(json.dumps(entry), encoding='utf-8')
+
+    assert scraper._fetch_page(URL) == '<html>cached</html>'
+    assert calls == [{
+        'If-None-Match': '"v1"',
+        'If-Modified-Since': 'Wed, 01 Oct 2025 10:00:00 GMT'
+    }]
+
+    # The 304 refreshed the entry, so the next fetch stays local
+    assert scraper._read_cache(URL)['fetched_at'] > entry['fetched_at']
+    assert scraper._fetch_page(URL) == '<html>cached</html>'
+    assert len(calls) == 1
+
+
+def test_fetch_page_unusable_cache_falls_back_to_network(tmp_path, monkeypatch):
+    """Test that corrupt or incomplete cache entries are treated as misses"""
+    scraper, calls = make_cached_scraper(tmp_path, monkeypatch)
+    path = scraper._cache_path(URL)
+
+    for contents in ('{"body": "<html>trunc', '{"body": "<html>old</html>"}', '[]'):
+        path.write_text(contents, encoding='utf-8')
+        assert scraper._fetch_page(URL) == '<html>network</html>'
+
+    assert calls == [{}, {}, {}]
+
+
+def test_session_retry_configuration():
+    """Test that max_retries counts total attempts on the mounted adapters"""
+    scraper = WikipediaScraper(max_retries=4)
+
+    for prefix in ('https://', 'http://'):
+        retry = scraper.session.get_adapter(prefix + 'example.com').max_retries
+        assert retry.total == 3
+        assert set(retry.status_forcelist) == {429, 500, 502, 503, 504}
+
+    assert WikipediaScraper(max_retries=1).session.get_adapter('https://example.com').max_retries.total == 0
+
+
+def test_scrape_many_keeps_order_and_failures(monkeypatch):
+    """Test that scrape_many returns one result per topic, in input order"""
+    scraper = WikipediaScraper(rate_limit_delay=0)
+
+    def fake_fetch_and_parse(topic):
+        if topic == "Missing":
+            return None
+        return PageContent(title=topic, url=scraper.get_page_url(topic), raw_html=None, text_content=topic)
+
+    monkeypatch.setattr(scraper, 'fetch_and_parse', fake_fetch_and_parse)
+
+    topics = ["Alpha", "Missing", "Beta", "Gamma", "Delta"]
+    pages = scraper.scrape_many(topics, max_workers=3)
+
+    assert [page.title if page else None for page in pages] == ["Alpha", None, "Beta", "Gamma", "Delta"]
+
+
+def test_extract_text_from_html_skips_non_text():
+    """Test that scripts, styles, templates and ruby annotations are skipped"""
+    html = (
+        "<html><head><style>p { color: red; }</style></head><body>"
+        "<p>Tokyo <ruby>東京<rp>(</rp><rt>Tōkyō</rt><rp>)</rp></ruby> is big.</p>"
+        "<template><p>Hidden</p></template>"
+        "<script>var x = 1;</script><p>End</p>"
+        "</body></html>"
+    )
+    assert BaseScraper.extract_text_from_html(html) == "Tokyo 東京 is big.End"
+
+
+def test_extract_text_from_html_empty():
+    """Test that an empty document yields empty text"""
+    assert BaseScraper.extract_text_from_html("") == ""
+
+
+def test_page_content_word_count():
+    """Test that word_count is counted lazily unless passed in"""
+    page = PageContent(title="T", url="http://example.com/T", raw_html=None, text_content="one two three")
+    assert page.word_count == 3
+
+    page = PageContent(title="T", url="http://example.com/T", raw_html=None,
+                       text_content="one two three", word_count=10)
+    assert page.word_count == 10
@@ -43,6 +43,8 @@ def test_compare_identical_pages():
     assert result.text_similarity == 1.0
     assert result.similarity_category == "high"
     assert result.word_count_diff == 0
+    assert result.levenshtein_distance == 0
+    assert [segment.type for segment in result.diff_segments] == ['equal']
 
 
 def test_compare_different_pages():
@@ -134,3 +136,70 @@ def test_comparison_result_structure():
 
     # Check citation diff
     assert result.citation_diff == -5  # page1 has 5 fewer citations
+
+
+def test_levenshtein_distance():
+    """Test exact edit distance calculation"""
+    comparator = PageComparator()
+
+    assert comparator._calculate_levenshtein_distance("kitten", "sitting") == 3
+    assert comparator._calculate_levenshtein_distance("same", "same") == 0
+    assert comparator._calculate_levenshtein_distance("", "abc") == 3
+
+
+def test_compare_reuses_cached_text_metrics():
+    """Test that repeated comparisons reuse cached text metrics"""
+    comparator = PageComparator(cache_size=1)
+
+    page1 = create_sample_page("Test1", "The quick brown fox jumps over the lazy dog. " * 5)
+    page2 = create_sample_page("Test2", "The quick brown fox jumps over the lazy cat. " * 5)
+
+    first = comparator.compare(page1, page2)
+    first.diff_segments[0].type = 'mutated'  # Must not affect the cache
+    second = comparator.compare(page1, page2)
+
+    assert second.text_similarity == first.text_similarity
+    assert second.levenshtein_distance == first.levenshtein_distance
+    assert second.diff_segments[0].type != 'mutated'
+    assert second.diff_segments == PageComparator().compare(page1, page2).diff_segments
+
+    comparator.compare(page2, page1)
+    assert len(comparator._text_cache) == 1
+
+
+def test_word_diff_reconstructs_texts():
+    """Test that word level diffs of long texts cover both texts exactly"""
+    comparator = PageComparator()
+
+    text1 = "The quick brown fox jumps over the lazy dog. " * 300
+    text2 = text1.replace("lazy dog", "sleepy cat", 5) + " Extra  sentence."
+
+    diffs = comparator._diff_words(text1, text2)
+
+    assert ''.join(text for op, text in diffs if op <= 0) == text1
+    assert ''.join(text for op, text in diffs if op >= 0) == text2
+    assert len(comparator._generate_diff_segments(text1, text2)) > 1
+
+
+def test_compare_many_matches_compare():
+    """Test that batch comparison in worker processes matches compare()"""
+    comparator = PageComparator()
+
+    pairs = [
+        (
+            create_sample_page(f"Test{i}", f"Page {i} talks about topic number {i}. " * 10, citations=i),
+            create_sample_page(f"Test{i}", f"Page {i} discusses topic {i} in depth. " * 10)
+        )
+        for i in range(5)
+    ]
+
+    results = comparator.compare_many(pairs, max_workers=2)
+
+    assert len(results) == len(pairs)
+    for result, (grok_page, wiki_page) in zip(results, pairs):
+        expected = comparator.compare(grok_page, wiki_page)
+        assert result.grokipedia_page is grok_page
+        assert result.wikipedia_page is wiki_page
+        assert result.text_similarity == expected.text_similarity
+        assert result.diff_segments == expected.diff_segments
+        assert result.key_differences == expected.key_differences
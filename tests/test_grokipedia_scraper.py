@@ -0,0 +1,141 @@
+"""
+Unit tests for GrokipediaScraper
+"""
+
+from datetime import datetime, timezone
+from pathlib import Path
+
+import pytest
+from src.scrapers.grokipedia_scraper import GrokipediaScraper
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+@pytest.fixture
+def scraper():
+    """Scraper without rate limiting"""
+    return GrokipediaScraper(rate_limit_delay=0)
+
+
+@pytest.fixture
+def page(scraper):
+    """The Grokipedia fixture page, parsed"""
+    html = (FIXTURES / 'grokipedia_page.html').read_text(encoding='utf-8')
+    return scraper.parse_page(html, 'https://grokipedia.com/page/Ada_Lovelace')
+
+
+def test_parse_fixture_page(page):
+    """Test every field extracted from the fixture page"""
+    assert page.title == 'Ada Lovelace'
+    assert page.text_content.startswith('Ada Lovelace Last updated 27 October 2025 Born10 December 1815 ')
+    assert 'Grokipedia' not in page.text_content  # Header navigation is outside <main>
+    assert page.sections == {
+        'Introduction': 'Early life and education Augusta Ada King, Countess of Lovelace, '
+                        'was an English mathematician.[1]',
+        'Early life': 'She was the only legitimate child of Lord Byron.[2]',
+        'Work': 'Her notes on the Analytical Engine include the first published algorithm.[3]',
+        'External links': 'Ada Lovelace Day\nCharles Babbage\nAnalytical Engine Toole, Betty. '
+                          'Ada, the Enchantress of Numbers.\nMoore, Doris. Ada, Countess of Lovelace.'
+    }
+    assert page.citations == [
+        {'number': 1, 'id': 'cite-1', 'text': '[1]'},
+        {'number': 2, 'id': 'ref-2', 'text': '[3]'},
+        {'number': 3, 'id': 'ref-3', 'text': '[2]'},
+        {'number': 4, 'id': 'ref-4', 'text': 'Toole, Betty. Ada, the Enchantress of Numbers.'},
+        {'number': 5, 'id': 'ref-5', 'text': 'Moore, Doris. Ada, Countess of Lovelace.'}
+    ]
+    assert page.infobox == {'Born': '10 December 1815', 'Known for': 'Analytical Engine'}
+    assert page.images == [
+        'https://grokipedia.com/images/ada.jpg',
+        'https://cdn.grokipedia.com/babbage.png',
+        'https://cdn.grokipedia.com/engine.jpg'
+    ]
+    assert page.external_links == ['https://example.org/ada']
+    assert page.last_modified == datetime(2025, 10, 27)
+
+
+def test_parse_skips_nav_headings(page):
+    """Test that a table-of-contents heading does not start a section"""
+    assert 'Contents' not in page.sections
+    assert page.sections['Introduction'].startswith('Early life and education')
+
+
+def test_parse_deduplicates_categories(page):
+    """Test that categories repeated across containers are kept once, in page order"""
+    assert page.categories == ['Mathematicians', 'Computer pioneers', 'English women']
+
+
+@pytest.mark.parametrize('body, expected', [
+    ('<h1>Plain</h1><h1 class="page-title">Page</h1><h1 class="title">Titled</h1>'
+     '<h1 id="firstHeading">First</h1>', 'First'),
+    ('<h1>Plain</h1><h1 class="page-title">Page</h1><h1 class="title">Titled</h1>', 'Titled'),
+    ('<h1>Plain</h1><h1 class="page-title">Page</h1>', 'Page'),
+    ('<h1>Plain - Grokipedia</h1>', 'Plain'),
+    ('<h1 id="firstHeading"> </h1>', 'From Title Tag'),
+    ('', 'From Title Tag'),
+])
+def test_title_fallback_chain(scraper, body, expected):
+    """Test the title lookup order, regardless of document order"""
+    html = f'<html><head><title>From Title Tag — Grokipedia</title></head><body>{body}</body></html>'
+    assert scraper.parse_page(html, 'u').title == expected
+
+
+def test_title_unknown(scraper):
+    """Test the title when no candidate has text"""
+    assert scraper.parse_page('<html><body><p>Text</p></body></html>', 'u').title == 'Unknown Title'
+
+
+INFOBOXES = {
+    'table.info': '<table class="page-info"><tr><th>Source</th><td>table.info</td></tr></table>',
+    'aside.infobox': '<aside class="infobox"><table><tr><th>Source</th><td>aside.infobox</td></tr></table></aside>',
+    'div.infobox': '<div class="infobox"><table><tr><th>Source</th><td>div.infobox</td></tr></table></div>',
+    'table.infobox': '<table class="infobox"><tr><th>Source</th><td>table.infobox</td></tr></table>',
+}
+
+
+@pytest.mark.parametrize('expected', list(INFOBOXES))
+def test_infobox_fallback_chain(scraper, expected):
+    """Test the infobox lookup order, regardless of document order"""
+    # Keep the expected candidate and every lower-priority one
+    candidates = list(INFOBOXES)[:list(INFOBOXES).index(expected) + 1]
+    html = '<html><body>' + ''.join(INFOBOXES[key] for key in candidates) + '</body></html>'
+    assert scraper.parse_page(html, 'u').infobox == {'Source': expected}
+
+
+def test_infobox_reads_definition_lists_in_rows(scraper):
+    """Test dt/dd pairs inside rows and that rows without a value are skipped"""
+    html = (
+        '<html><body><div class="infobox"><table>'
+        '<tr><dt>Born</dt><dd>1815</dd></tr><tr><th>Empty</th><td> </td></tr>'
+        '</table></div></body></html>'
+    )
+    assert scraper.parse_page(html, 'u').infobox == {'Born': '1815'}
+
+
+DATES = [
+    ('<footer><ul><li id="footer-info-lastmod">Last edited on 1 January 2021</li></ul></footer>',
+     datetime(2021, 1, 1)),
+    ('<meta property="article:modified_time" content="2022-02-02T12:00:00Z">',
+     datetime(2022, 2, 2, 12, tzinfo=timezone.utc)),
+    ('<div class="last-modified">Modified 3 March 2023</div>', datetime(2023, 3, 3)),
+    ('<span class="date">4 April 2024</span>', datetime(2024, 4, 4)),
+    ('<time datetime="2025-05-05">5 May 2025</time>', datetime(2025, 5, 5)),
+]
+
+
+@pytest.mark.parametrize('count', range(1, len(DATES) + 1))
+def test_last_modified_fallback_chain(scraper, count):
+    """Test the date lookup order: time, span/div date classes, meta, footer item"""
+    html = '<html><body>' + ''.join(markup for markup, _ in DATES[:count]) + '</body></html>'
+    assert scraper.parse_page(html, 'u').last_modified == DATES[count - 1][1]
+
+
+def test_last_modified_skips_unparseable_candidates(scraper):
+    """Test that a candidate without a usable date falls through to the next"""
+    html = (
+        '<html><body><time datetime="soon">Coming soon</time>'
+        '<span class="date">31 February 2024</span>'
+        '<li id="footer-info-lastmod">Edited 6 June 2026</li></body></html>'
+    )
+    assert scraper.parse_page(html, 'u').last_modified == datetime(2026, 6, 6)
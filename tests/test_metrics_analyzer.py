@@ -0,0 +1,125 @@
+"""
+Unit tests for MetricsAnalyzer
+"""
+
+import pytest
+from src.analyzers.metrics_analyzer import (
+    MetricsAnalyzer, QualityMetrics, BiasMetrics, _TextStats, _VECTORIZE_MIN_CHARS
+)
+
+
+SAMPLE_TEXT = (
+    "The cat sat on the mat. It was a remarkable cat! "
+    "Some say the cat is clearly the best. Perhaps it is."
+)
+
+
+def test_analyzer_initialization():
+    """Test that analyzer initializes correctly"""
+    analyzer = MetricsAnalyzer()
+    assert analyzer is not None
+
+
+def test_quality_metrics_empty_text():
+    """Test that empty text yields default metrics"""
+    analyzer = MetricsAnalyzer()
+    assert analyzer.calculate_quality_metrics("", 5) == QualityMetrics()
+
+
+def test_quality_metrics_values():
+    """Test quality metrics on a small sample"""
+    analyzer = MetricsAnalyzer()
+    metrics = analyzer.calculate_quality_metrics(SAMPLE_TEXT, 2)
+
+    # 22 words, 4 sentences
+    assert metrics.citation_density == pytest.approx(2 / 22 * 1000)
+    assert metrics.avg_sentence_length == pytest.approx(22 / 4)
+    assert 0.0 <= metrics.readability_score <= 100.0
+    assert 0.0 <= metrics.complexity_score <= 1.0
+
+
+def test_count_syllables():
+    """Test syllable approximation"""
+    analyzer = MetricsAnalyzer()
+
+    assert analyzer._count_syllables("cat") == 1
+    assert analyzer._count_syllables("remarkable") == 3
+    assert analyzer._count_syllables("the") == 1  # Never below one
+
+
+def test_bias_metrics_empty_text():
+    """Test that empty text yields default bias metrics"""
+    analyzer = MetricsAnalyzer()
+    assert analyzer.calculate_bias_metrics("") == BiasMetrics()
+
+
+def test_bias_metrics_counts():
+    """Test loaded language, hedge and first person counts"""
+    analyzer = MetricsAnalyzer()
+    metrics = analyzer.calculate_bias_metrics(
+        "Obviously we think our results are clearly good. Some say it is perhaps bad."
+    )
+
+    assert metrics.loaded_language_count == 2
+    assert metrics.hedge_words_count == 2
+    assert metrics.first_person_count == 2
+    assert metrics.sentiment_polarity == 0.0
+    assert 0.0 < metrics.subjectivity_score <= 1.0
+
+
+def test_quality_metrics_cache():
+    """Test that repeated analysis returns equal, independent results"""
+    analyzer = MetricsAnalyzer(cache_size=1)
+
+    first = analyzer.calculate_quality_metrics(SAMPLE_TEXT, 2)
+    first.readability_score = -1.0  # Mutating a result must not affect the cache
+    second = analyzer.calculate_quality_metrics(SAMPLE_TEXT, 2)
+
+    assert second.readability_score != -1.0
+    assert second == MetricsAnalyzer().calculate_quality_metrics(SAMPLE_TEXT, 2)
+
+    analyzer.calculate_quality_metrics("Another text.", 0)
+    assert len(analyzer._quality_cache) == 1
+
+
+def test_sentiment_matches_whole_words():
+    """Test that sentiment words are not matched inside longer words"""
+    analyzer = MetricsAnalyzer()
+
+    assert analyzer._calculate_simple_sentiment("a badge of honour") == 0.0
+    assert analyzer._calculate_simple_sentiment("an insignificant change") == -1.0
+    assert analyzer._calculate_simple_sentiment("good, great and bad") == pytest.approx(1 / 3)
+
+
+ASCII_LONG_TEXT = (
+    "The Analytical Engine was a proposed mechanical general-purpose computer. "
+    "Rhythm, style and grace: were they TRUE?! Lovelace's notes (1843) included "
+    "an algorithm, e.g. Bernoulli numbers...\tSee also:\nCharles Babbage; the "
+    "Difference Engine, queue, aeiouy, b, e, ee, three-phase code. "
+) * 12
+
+NON_ASCII_LONG_TEXT = (
+    "Zoë Brontë visited the café in Zürich\u00a0on Tuesday \u2014 naïve, "
+    "façade, résumé! 東京 (Tōkyō) is the capital.\u2003Ελληνικά text\u2009here; "
+    "smörgåsbord and jalapeño are tasty. Née Ada? Señor Núñez agrees. "
+) * 12
+
+
+@pytest.mark.parametrize('text', [ASCII_LONG_TEXT, NON_ASCII_LONG_TEXT], ids=['ascii', 'non-ascii'])
+def test_vectorized_analysis_matches_word_loop(text):
+    """Test that the NumPy path counts exactly like the per-word loop on long texts"""
+    assert len(text) >= _VECTORIZE_MIN_CHARS
+    assert len(text.lower()) == len(text)  # Stays on the vectorized path
+
+    analyzer = MetricsAnalyzer()
+    vectorized = analyzer._analyze(text)
+    expected = analyzer._analyze_words(text, _TextStats(
+        sentences=analyzer._split_sentences(text),
+        sentence_word_sum=vectorized.sentence_word_sum
+    ))
+
+    assert vectorized.word_count == expected.word_count == len(text.split())
+    assert vectorized.total_chars == expected.total_chars
+    assert vectorized.total_syllables == expected.total_syllables
+    assert vectorized.sentences == expected.sentences
+    assert vectorized.sentence_count == expected.sentence_count
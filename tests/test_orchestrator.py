@@ -0,0 +1,124 @@
+"""
+Unit tests for ComparisonOrchestrator
+"""
+
+import asyncio
+import json
+from dataclasses import asdict
+
+from main import ComparisonOrchestrator
+from src.analyzers.metrics_analyzer import MetricsAnalyzer
+from src.comparators.page_comparator import PageComparator
+from src.visualizers.report_generator import ReportGenerator
+from tests.test_comparator import create_sample_page
+
+
+def make_orchestrator_with_results(count=6):
+    """Orchestrator holding count comparison results"""
+    orchestrator = ComparisonOrchestrator()
+    comparator = PageComparator()
+
+    for i in range(count):
+        grok = create_sample_page(f"Topic{i}", f"Grokipedia text {i} is clearly great. " * (i + 5), citations=i)
+        wiki = create_sample_page(f"Topic{i}", f"Wikipedia text {i} is a poor summary. " * (i + 3), citations=i + 2)
+        orchestrator.results.append(comparator.compare(grok, wiki))
+
+    return orchestrator
+
+
+def test_analyze_results_matches_analyzer():
+    """Test that pooled analysis stores the same metrics as direct analyzer calls"""
+    orchestrator = make_orchestrator_with_results()
+    orchestrator.analyze_results(max_workers=2)
+
+    analyzer = MetricsAnalyzer()
+    for result in orchestrator.results:
+        for page in (result.grokipedia_page, result.wikipedia_page):
+            assert page.metadata['quality_metrics'] == analyzer.calculate_quality_metrics(
+                page.text_content, page.citation_count
+            )
+            assert page.metadata['bias_metrics'] == analyzer.calculate_bias_metrics(page.text_content)
+
+
+def test_analyzed_metrics_are_saved_and_exported(tmp_path):
+    """Test that analyzed metrics reach the saved results and the JSON export"""
+    orchestrator = make_orchestrator_with_results()
+    orchestrator.analyze_results(max_workers=2)
+
+    orchestrator.save_results(str(tmp_path / "results.json"))
+    export_path = ReportGenerator(output_dir=str(tmp_path)).export_json(orchestrator.results, "export.json")
+
+    analyzer = MetricsAnalyzer()
+    for path in (tmp_path / "results.json", export_path):
+        with open(path, encoding='utf-8') as f:
+            records = json.load(f)
+
+        assert len(records) == len(orchestrator.results)
+        for record, result in zip(records, orchestrator.results):
+            for source, page in (('grokipedia', result.grokipedia_page), ('wikipedia', result.wikipedia_page)):
+                assert record[f'quality_metrics_{source}'] == asdict(
+                    analyzer.calculate_quality_metrics(page.text_content, page.citation_count)
+                )
+                assert record[f'bias_metrics_{source}'] == asdict(analyzer.calculate_bias_metrics(page.text_content))
+
+
+def test_unanalyzed_results_have_no_metrics(tmp_path):
+    """Test that results saved without analysis keep the plain record layout"""
+    orchestrator = make_orchestrator_with_results(count=2)
+    orchestrator.save_results(str(tmp_path / "results.json"))
+
+    with open(tmp_path / "results.json", encoding='utf-8') as f:
+        records = json.load(f)
+
+    assert not any(key.endswith(('_grokipedia', '_wikipedia')) for record in records for key in record)
+
+
+class StubScraper:
+    """Scraper stand-in whose async fetch sleeps, and fails for one topic"""
+
+    def __init__(self, source, failing_topic=None):
+        self.source = source
+        self.failing_topic = failing_topic
+        self.in_flight = 0
+        self.peak = 0
+
+    async def afetch_and_parse(self, topic):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        try:
+            # Later topics finish first, so gather order is what keeps results in order
+            await asyncio.sleep(0.01 * (10 - int(topic[5:])))
+            if topic == self.failing_topic:
+                raise RuntimeError("fetch failed")
+            return create_sample_page(topic, f"{self.source} text about {topic}. " * 5)
+        finally:
+            self.in_flight -= 1
+
+
+def test_compare_topics_async_order_errors_and_concurrency():
+    """Test that results keep topic order, a failure is isolated and concurrency is bounded"""
+    orchestrator = ComparisonOrchestrator()
+    orchestrator.wikipedia_scraper = StubScraper("Wikipedia", failing_topic="Topic3")
+    orchestrator.grokipedia_scraper = StubScraper("Grokipedia")
+
+    topic_list = [("Science", f"Topic{i}") for i in range(8)]
+    results = asyncio.run(orchestrator._compare_topics_async(topic_list, max_concurrency=3))
+
+    assert [result.topic if result else None for result in results] == [
+        "Topic0", "Topic1", "Topic2", None, "Topic4", "Topic5", "Topic6", "Topic7"
+    ]
+    assert results[0].wikipedia_page.metadata['category'] == "Science"
+    assert orchestrator.wikipedia_scraper.peak == 3
+    assert orchestrator.grokipedia_scraper.peak == 3
+
+
+def test_run_comparison_skips_failed_topics():
+    """Test that run_comparison keeps the successful results in topic order"""
+    orchestrator = ComparisonOrchestrator()
+    orchestrator.wikipedia_scraper = StubScraper("Wikipedia", failing_topic="Topic1")
+    orchestrator.grokipedia_scraper = StubScraper("Grokipedia")
+
+    orchestrator.run_comparison(topics=["Topic0", "Topic1", "Topic2"], max_concurrency=1)
+
+    assert [result.topic for result in orchestrator.results] == ["Topic0", "Topic2"]
+    assert orchestrator.wikipedia_scraper.peak == 1
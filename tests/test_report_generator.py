@@ -0,0 +1,192 @@
+"""
+Unit tests for ReportGenerator
+"""
+
+import json
+
+import pytest
+from src.analyzers.metrics_analyzer import MetricsAnalyzer
+from src.comparators.page_comparator import PageComparator, ComparisonResult
+from src.visualizers.report_generator import ReportGenerator
+from tests.test_comparator import create_sample_page
+
+
+# Similarities for topics T0..T13, with ties at 0.9, 0.5 and 0.1 and one
+# across the bottom-10 cut-off
+SUMMARY_SIMILARITIES = [0.5, 0.9, 0.9, 0.1, 0.5, 0.95, 0.3, 0.9, 0.1, 0.7, 0.2, 0.5, 1.0, 0.1]
+
+
+def make_summary_results():
+    """Fixed comparison results with known aggregates"""
+    page = create_sample_page("Page", "Some page content. " * 10)
+    results = []
+    for i, similarity in enumerate(SUMMARY_SIMILARITIES):
+        word_diff = (i % 5 - 2) * 10
+        results.append(ComparisonResult(
+            topic=f"T{i}",
+            grokipedia_page=page,
+            wikipedia_page=page,
+            text_similarity=similarity,
+            similarity_category='high' if similarity >= 0.7 else 'medium' if similarity >= 0.4 else 'low',
+            word_count_diff=word_diff,
+            word_count_diff_pct=word_diff * 2.0,
+            citation_diff=i % 3 - 1,
+            unique_to_grokipedia=[f"Section {n}" for n in range(i % 4)],
+            unique_to_wikipedia=["History", "Legacy"] if i == 6 else []
+        ))
+    return results
+
+
+def report_lines_after(report, heading, count):
+    """The count lines following a section heading and its blank line"""
+    lines = report.split("\n")
+    start = lines.index(heading) + 2
+    return lines[start:start + count]
+
+
+def test_generate_summary_report(tmp_path):
+    """Test the summary report's aggregates, top/bottom lists and tie order"""
+    generator = ReportGenerator(output_dir=str(tmp_path))
+    report = generator.generate_summary_report(make_summary_results(), "summary.txt")
+
+    assert (tmp_path / "summary.txt").read_text(encoding='utf-8') == report
+    assert "Total Pages Analyzed: 14\n" in report
+
+    assert report_lines_after(report, "## OVERALL STATISTICS", 5) == [
+        "Average Similarity: 54.64%",
+        "High Similarity: 6 pages",
+        "Medium Similarity: 3 pages",
+        "Low Similarity: 5 pages",
+        "Average Word Count Difference: 11 words"
+    ]
+    assert report_lines_after(report, "## CONTENT ANALYSIS", 4) == [
+        "Pages longer on Grokipedia: 5",
+        "Pages longer on Wikipedia: 6",
+        "Pages with more citations on Grokipedia: 4",
+        "Pages with more citations on Wikipedia: 5"
+    ]
+    # Ties go to the first result, as max() picks them
+    assert report_lines_after(report, "## NOTABLE DIFFERENCES", 6) == [
+        "Biggest word count difference: T0",
+        "  40.0% difference",
+        "Most unique sections on Grokipedia: T3",
+        "  3 unique sections",
+        "Most unique sections on Wikipedia: T6",
+        "  2 unique sections"
+    ]
+
+    # Equal similarities are listed in input order, as a stable sort lists them
+    top = [line.split(":")[0] for line in report_lines_after(report, "## TOP 10 MOST SIMILAR PAGES", 11)]
+    assert top == ["1. T12", "2. T5", "3. T1", "4. T2", "5. T7", "6. T9",
+                   "7. T0", "8. T4", "9. T11", "10. T6", ""]
+    bottom = [line.split(":")[0] for line in report_lines_after(report, "## TOP 10 MOST DIFFERENT PAGES", 11)]
+    assert bottom == ["1. T3", "2. T8", "3. T13", "4. T10", "5. T6",
+                      "6. T0", "7. T4", "8. T11", "9. T9", "10. T1", ""]
+    assert "1. T12: 100.00% similarity" in report
+    assert "10. T1: 90.00% similarity" in report
+
+
+def test_generate_summary_report_empty(tmp_path):
+    """Test that no results give a short message instead of a report"""
+    assert ReportGenerator(output_dir=str(tmp_path)).generate_summary_report([]) == "No comparison results to report."
+
+
+def test_generate_detailed_reports_one_file_per_result(tmp_path):
+    """Test that batch reports never overwrite each other, even for topics with the same file name"""
+    comparator = PageComparator()
+    topics = ["C++", "C#", "C+", "C++", "Python", "Go"]
+    results = [
+        comparator.compare(
+            create_sample_page(topic, f"Grokipedia article about {topic} number {i}. " * 5),
+            create_sample_page(topic, f"Wikipedia article about {topic} number {i}. " * 5)
+        )
+        for i, topic in enumerate(topics)
+    ]
+
+    generator = ReportGenerator(output_dir=str(tmp_path))
+    reports = generator.generate_detailed_reports(results, max_workers=4)
+
+    files = sorted(tmp_path.glob("detailed_*.txt"))
+    assert len(files) == len(results)
+    assert sorted(path.read_text(encoding='utf-8') for path in files) == sorted(reports)
+    for report, topic in zip(reports, topics):
+        assert f"DETAILED COMPARISON: {topic}\n" in report
+
+
+@pytest.mark.parametrize('count', [0, 1, 4])
+def test_export_json_matches_json_dump(tmp_path, count):
+    """Test that the streamed export is byte-identical to json.dumps(records, indent=2)"""
+    comparator = PageComparator()
+    topics = ["Zürich", "東京", "C++", "Ada \"The Enchantress\" Lovelace"][:count]
+    results = [
+        comparator.compare(
+            create_sample_page(topic, f"Grokipedia article about {topic}. " * 5),
+            create_sample_page(topic, f"Wikipedia article on {topic}. " * 4)
+        )
+        for topic in topics
+    ]
+    if results:
+        # Nested metric dicts must be indented like the rest of the record
+        analyzer = MetricsAnalyzer()
+        page = results[0].grokipedia_page
+        page.metadata['quality_metrics'] = analyzer.calculate_quality_metrics(page.text_content, page.citation_count)
+        page.metadata['bias_metrics'] = analyzer.calculate_bias_metrics(page.text_content)
+
+    generator = ReportGenerator(output_dir=str(tmp_path))
+    path = generator.export_json(results, "export.json")
+
+    expected = json.dumps([ReportGenerator._result_to_dict(result) for result in results], indent=2)
+    with open(path, encoding='utf-8', newline='') as f:
+        assert f.read() == expected
+
+
+def distribution_lines(report):
+    """The ten histogram rows of a summary report"""
+    return report_lines_after(report, "## SIMILARITY DISTRIBUTION", 11)[1:]
+
+
+def make_results_with_similarities(similarities):
+    """Minimal comparison results with the given similarities"""
+    page = create_sample_page("Page", "Some page content. " * 10)
+    return [
+        ComparisonResult(topic=f"T{i}", grokipedia_page=page, wikipedia_page=page, text_similarity=similarity)
+        for i, similarity in enumerate(similarities)
+    ]
+
+
+def test_similarity_distribution_unscaled(tmp_path):
+    """Test one block per page while the busiest bucket fits in the bar width"""
+    results = make_results_with_similarities([0.05, 0.35, 0.35, 0.95, 1.0] + [0.55] * 60)
+    report = ReportGenerator(output_dir=str(tmp_path)).generate_summary_report(results, "summary.txt")
+
+    assert distribution_lines(report) == [
+        "  0.0-0.1: █ (1)",
+        "  0.1-0.2:  (0)",
+        "  0.2-0.3:  (0)",
+        "  0.3-0.4: ██ (2)",
+        "  0.4-0.5:  (0)",
+        "  0.5-0.6: " + "█" * 60 + " (60)",
+        "  0.6-0.7:  (0)",
+        "  0.7-0.8:  (0)",
+        "  0.8-0.9:  (0)",
+        "  0.9-1.0: ██ (2)"  # 1.0 falls in the top bucket
+    ]
+
+
+def test_similarity_distribution_scaled(tmp_path):
+    """Test that bars are scaled to the maximum width and small buckets stay visible"""
+    results = make_results_with_similarities([0.55] * 200 + [0.75] * 100 + [0.35] + [0.15] * 3 + [0.95] * 4)
+    report = ReportGenerator(output_dir=str(tmp_path)).generate_summary_report(results, "summary.txt")
+
+    assert distribution_lines(report) == [
+        "  0.0-0.1:  (0)",
+        "  0.1-0.2: █ (3)",
+        "  0.2-0.3:  (0)",
+        "  0.3-0.4: █ (1)",
+        "  0.4-0.5:  (0)",
+        "  0.5-0.6: " + "█" * 60 + " (200)",
+        "  0.6-0.7:  (0)",
+        "  0.7-0.8: " + "█" * 30 + " (100)",
+        "  0.8-0.9:  (0)",
+        "  0.9-1.0: █ (4)"
+    ]
@@ -0,0 +1,210 @@
+"""
+Unit tests for WikipediaScraper
+"""
+
+import asyncio
+from datetime import datetime
+from pathlib import Path
+
+import pytest
+from src.scrapers.wikipedia_scraper import WikipediaScraper
+
+
+FIXTURES = Path(__file__).parent / 'fixtures'
+
+
+# A formatversion=1 action=parse payload, as returned by _fetch_via_api
+API_PARSE_DATA = {
+    'title': 'Ada Lovelace',
+    'revid': 1234567,
+    'text': {
+        '*': (
+            '<div class="mw-parser-output">'
+            '<p>Ada Lovelace was an English mathematician.</p>'
+            '<h2><span class="mw-headline" id="Work">Work</span></h2>'
+            '<p>She wrote the first published algorithm.'
+            '<sup class="reference"><a href="#cite_note-1">[1]</a></sup></p>'
+            '</div>'
+        )
+    },
+    'categories': [
+        {'sortkey': '', 'hidden': '', '*': 'Articles_with_short_description'},
+        {'sortkey': '', '*': 'English_women_mathematicians'}
+    ]
+}
+
+
+@pytest.fixture
+def scraper():
+    """Scraper without rate limiting"""
+    return WikipediaScraper(rate_limit_delay=0)
+
+
+@pytest.fixture
+def page(scraper):
+    """The MediaWiki fixture page, parsed"""
+    html = (FIXTURES / 'wikipedia_page.html').read_text(encoding='utf-8')
+    return scraper.parse_page(html, 'https://en.wikipedia.org/wiki/Ada_Lovelace')
+
+
+def test_parse_title(page):
+    """Test that the title comes from h1#firstHeading"""
+    assert page.title == 'Ada Lovelace'
+
+
+def test_parse_title_falls_back_to_title_tag(scraper):
+    """Test the <title> fallback when there is no first heading"""
+    page = scraper.parse_page('<html><head><title>Ada Lovelace - Wikipedia</title></head></html>', 'u')
+    assert page.title == 'Ada Lovelace'
+
+
+def test_parse_sections(page):
+    """Test that content is grouped under its h2/h3 headline"""
+    assert list(page.sections) == ['Introduction', 'Biography', 'Work', 'External links']
+    assert page.sections['Introduction'] == 'Ada Lovelace was an English mathematician.[1]'
+    assert page.sections['Biography'] == 'She was the daughter of Lord Byron.[2] Born in LondonDied in Marylebone'
+    assert page.sections['Work'] == 'She wrote the first published algorithm.'
+
+
+def test_parse_content(page):
+    """Test the article text, which excludes scripts, styles and page chrome"""
+    assert page.text_content.startswith('Ada Lovelace Born10 December 1815 Known\xa0forAnalytical Engine ')
+    assert 'Biographyedit She was the daughter of Lord Byron.[2] Born in LondonDied in Marylebone' in page.text_content
+    assert page.text_content.endswith('^ Toole, Betty. Ada, the Enchantress of Numbers. ^ Moore, Doris.')
+    for chrome in ('RLCONF', 'font-style', 'Categories', 'last edited'):
+        assert chrome not in page.text_content
+    assert page.word_count == 53
+
+
+def test_parse_citations(page):
+    """Test that sup.reference links become numbered citations"""
+    assert page.citations == [
+        {'number': 1, 'id': 'cite_note-1', 'text': '[1]'},
+        {'number': 2, 'id': 'cite_note-2', 'text': '[2]'}
+    ]
+    assert page.citation_count == 2
+
+
+def test_parse_infobox(page):
+    """Test that infobox rows with both a header and a value are kept"""
+    assert page.infobox == {'Born': '10 December 1815', 'Known\xa0for': 'Analytical Engine'}
+
+
+def test_parse_images(page):
+    """Test that protocol-relative URLs are completed and SVG icons skipped"""
+    assert page.images == ['https://upload.wikimedia.org/ada.jpg']
+
+
+def test_parse_categories(page):
+    """Test that only the visible category links are listed"""
+    assert page.categories == ['1815 births', 'English women mathematicians']
+
+
+def test_parse_external_links(page):
+    """Test that only a.external links under the External links heading are listed"""
+    assert page.external_links == ['https://example.org/ada', 'https://example.com/papers']
+
+
+def test_parse_last_modified(page):
+    """Test that the footer's last-edited date is parsed"""
+    assert page.last_modified == datetime(2024, 10, 31)
+
+
+def test_parse_empty_document(scraper):
+    """Test that an empty document parses to an empty page"""
+    page = scraper.parse_page('', 'u')
+    assert page.title == 'Unknown Title'
+    assert page.text_content == ''
+    assert page.sections == {}
+    assert page.infobox is None
+    assert page.last_modified is None
+
+
+def test_fetch_structured(scraper, monkeypatch):
+    """Test building a page from the parse API's JSON"""
+    monkeypatch.setattr(scraper, '_fetch_via_api', lambda topic: API_PARSE_DATA)
+
+    page = scraper.fetch_structured('Ada Lovelace')
+
+    # No <h1> in the API body, so the title must come from the JSON
+    assert page.title == 'Ada Lovelace'
+    assert page.url == 'https://en.wikipedia.org/wiki/Ada_Lovelace'
+    assert page.categories == ['English women mathematicians']
+    assert page.metadata['revid'] == 1234567
+    assert page.sections == {
+        'Introduction': 'Ada Lovelace was an English mathematician.',
+        'Work': 'She wrote the first published algorithm.[1]'
+    }
+    assert page.citation_count == 1
+    assert page.last_modified is None
+
+
+def test_afetch_structured(scraper, monkeypatch):
+    """Test that the async variant returns the same page"""
+    monkeypatch.setattr(scraper, '_fetch_via_api', lambda topic: API_PARSE_DATA)
+
+    page = asyncio.run(scraper.afetch_structured('Ada Lovelace'))
+
+    assert page == scraper.fetch_structured('Ada Lovelace')
+    assert page.title == 'Ada Lovelace'
+    assert page.categories == ['English women mathematicians']
+    assert page.metadata['revid'] == 1234567
+
+
+def test_fetch_structured_api_failure(scraper, monkeypatch):
+    """Test that a failed API request yields None"""
+    monkeypatch.setattr(scraper, '_fetch_via_api', lambda topic: None)
+
+    assert scraper.fetch_structured('Ada Lovelace') is None
+
+
+def parse_body(scraper, body):
+    """Parse an article body wrapped in the MediaWiki content divs"""
+    html = (
+        '<html><body><h1 id="firstHeading">Tokyo</h1><div id="mw-content-text">'
+        f'<div class="mw-parser-output">{body}</div></div></body></html>'
+    )
+    return scraper.parse_page(html, 'https://en.wikipedia.org/wiki/Tokyo')
+
+
+def test_parse_skips_ruby_annotations(scraper):
+    """Test that rt/rp annotations are dropped but the ruby base text and tails are kept"""
+    page = parse_body(scraper, (
+        '<p><b>Tokyo</b> (<ruby>東京<rp>(</rp><rt>Tōkyō</rt><rp>)</rp></ruby>) is the capital of Japan.</p>'
+        '<p>It was renamed <ruby><rb>東京</rb><rt>とう<b>きょう</b></rt></ruby> in 1868.</p>'
+    ))
+
+    assert page.text_content == 'Tokyo (東京) is the capital of Japan.It was renamed 東京 in 1868.'
+    assert page.sections == {
+        'Introduction': 'Tokyo (東京) is the capital of Japan. It was renamed 東京 in 1868.'
+    }
+
+
+def test_parse_skips_template_content(scraper):
+    """Test that <template> content, including nested elements, is not article text"""
+    page = parse_body(scraper, (
+        '<p>Tokyo is the capital of Japan.</p>'
+        '<template id="note"><p>Template <b>text</b> here</p></template>'
+        '<p>It lies on Tokyo Bay.</p>'
+    ))
+
+    assert page.text_content == 'Tokyo is the capital of Japan.It lies on Tokyo Bay.'
+    assert 'Template' not in ' '.join(page.sections.values())
+
+
+def test_parse_heading_without_headline_span(scraper):
+    """Test that a heading without an mw-headline span does not start a named section"""
+    page = parse_body(scraper, (
+        '<p>Tokyo is the capital of Japan.</p>'
+        '<h2><span class="mw-headline" id="History">History</span></h2>'
+        '<p>Edo was renamed Tokyo in 1868.</p>'
+        '<div class="mw-heading mw-heading2"><h2 id="Geography">Geography</h2></div>'
+        '<p>Tokyo lies on Tokyo Bay.</p>'
+    ))
+
+    # The heading still ends the previous section's text, whose name is reused
+    assert page.sections == {
+        'Introduction': 'Tokyo is the capital of Japan.',
+        'History': 'Tokyo lies on Tokyo Bay.'
+    }
+    assert 'GeographyTokyo lies on Tokyo Bay.' in page.text_content